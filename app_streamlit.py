@@ -7,16 +7,22 @@ Uses Streamlit secrets for API keys (no manual input required)
 
 import streamlit as st
 import requests
+import asyncio
 import json
+import queue
 import time
 import io
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from pathlib import Path
 from typing import Dict, List, Tuple, Optional
 import base64
 
 # Import utility modules
 from utils.scrape import scrape_and_clean
-from utils.script_prompt import build_messages, validate_script_response
+from utils.script_prompt import build_messages, validate_script_response, extract_complete_turns
 
 # Try to import audio modules with graceful fallback
 _AUDIO_AVAILABLE = True
@@ -233,6 +239,10 @@ def render_api_status(openai_api_key, elevenlabs_api_key):
             if st.button("🔄 Refresh", key="refresh_voices"):
                 with st.spinner("Refreshing voices..."):
                     try:
+                        # Bust the 5-minute voices cache so refresh
+                        # actually re-hits the API
+                        if hasattr(get_available_voices, "clear"):
+                            get_available_voices.clear()
                         voices = get_available_voices(elevenlabs_api_key)
                         st.session_state.available_voices = voices
                         st.success(f"Updated: {len(voices)} voices")
@@ -260,7 +270,15 @@ def render_voice_selection():
         return None, None, None, None
     
     st.markdown('<div class="section-header"><h3>🎭 Speaker Configuration</h3></div>', unsafe_allow_html=True)
-    
+
+    tts_model = st.selectbox(
+        "ElevenLabs Model",
+        ["eleven_flash_v2_5", "eleven_turbo_v2_5", "eleven_multilingual_v2"],
+        index=0,
+        help="Flash/Turbo synthesize 3-5x faster; Multilingual v2 trades speed for a small quality gain."
+    )
+    st.session_state.tts_model = tts_model
+
     col1, col2 = st.columns(2)
     
     voice_options = [(v['name'], v['voice_id']) for v in st.session_state.available_voices]
@@ -352,6 +370,30 @@ def render_article_section():
     
     return article_url, pause_duration, aussie_style
 
+def scrape_article_with_openai_check(article_url, openai_model, openai_api_key):
+    """Scrape the article while testing OpenAI access in parallel.
+
+    Both steps are blocking network I/O, so running them together via
+    asyncio.to_thread takes the scrape latency (~1-3s) off the critical
+    path. Returns (article, test_response).
+    """
+    import openai
+    openai.api_key = openai_api_key
+
+    async def _gather():
+        return await asyncio.gather(
+            asyncio.to_thread(scrape_and_clean, article_url),
+            asyncio.to_thread(
+                openai.ChatCompletion.create,
+                model=openai_model,
+                messages=[{"role": "user", "content": "Say 'test' as JSON: {\"test\": \"success\"}"}],
+                max_tokens=50,
+                temperature=0.1
+            )
+        )
+
+    return asyncio.run(_gather())
+
 def render_script_generation(openai_model, article_url, host_name, guest_name, aussie_style):
     """Render script generation section"""
     st.markdown('<div class="section-header"><h3>📝 Script Generation</h3></div>', unsafe_allow_html=True)
@@ -367,35 +409,26 @@ def render_script_generation(openai_model, article_url, host_name, guest_name, a
                 progress_bar = st.progress(0)
                 status_text = st.empty()
                 
-                # Step 1: Scrape article
-                status_text.text("📖 Scraping article content...")
+                # Step 1: Scrape article and test the OpenAI key concurrently
+                status_text.text("📖 Scraping article and checking OpenAI access...")
                 progress_bar.progress(20)
-                article = scrape_and_clean(article_url)
-                
-                # Step 2: Generate script
-                status_text.text("🤖 Generating conversational script...")
-                progress_bar.progress(50)
-                
+
                 openai_api_key, _ = get_api_keys()
-                
+
                 # Import OpenAI with error handling - using older version for compatibility
                 try:
                     import openai
                     openai.api_key = openai_api_key
-                    
-                    # Test the API key with a simple request
-                    test_response = openai.ChatCompletion.create(
-                        model=openai_model,
-                        messages=[{"role": "user", "content": "Say 'test' as JSON: {\"test\": \"success\"}"}],
-                        max_tokens=50,
-                        temperature=0.1
-                    )
-                    st.write(f"Debug: API test successful - {len(test_response.choices[0].message.content)} chars")
-                    
                 except ImportError:
                     st.error("❌ OpenAI package not installed. Please ensure 'openai==0.28.1' is in requirements.txt")
                     st.stop()
-                except Exception as e:
+
+                try:
+                    article, test_response = scrape_article_with_openai_check(
+                        article_url, openai_model, openai_api_key
+                    )
+                    st.write(f"Debug: API test successful - {len(test_response.choices[0].message.content)} chars")
+                except openai.error.OpenAIError as e:
                     st.error(f"❌ Error with OpenAI API: {str(e)}")
                     st.write("This could be due to:")
                     st.write("- Invalid API key")
@@ -403,7 +436,11 @@ def render_script_generation(openai_model, article_url, host_name, guest_name, a
                     st.write("- Model not available")
                     st.write("- Rate limiting")
                     st.stop()
-                
+
+                # Step 2: Generate script
+                status_text.text("🤖 Generating conversational script...")
+                progress_bar.progress(50)
+
                 messages = build_messages(
                     article_title=article["title"],
                     article_text=article["text"],
@@ -420,19 +457,31 @@ def render_script_generation(openai_model, article_url, host_name, guest_name, a
                 # st.write(f"Debug: Messages count: {len(messages)}")
                 
                 try:
-                    response = openai.ChatCompletion.create(
+                    # Stream tokens so completed turns can be reported while
+                    # the rest of the script is still generating
+                    response_stream = openai.ChatCompletion.create(
                         model=openai_model,
                         messages=messages,
-                        temperature=0.7
+                        temperature=0.7,
+                        stream=True
                     )
-                    
-                    # Debug: Show response structure
-                    # st.write(f"Debug: Response type: {type(response)}")
-                    # st.write(f"Debug: Response keys: {list(response.keys()) if hasattr(response, 'keys') else 'No keys'}")
-                    
-                    # Get the response content
-                    response_content = response.choices[0].message.content
-                    
+
+                    content_parts = []
+                    turns_seen = 0
+                    for chunk in response_stream:
+                        delta = chunk.choices[0].delta.get("content")
+                        if not delta:
+                            continue
+                        content_parts.append(delta)
+                        # Only rescan the buffer when a turn may have closed
+                        if '}' in delta:
+                            completed = len(extract_complete_turns(''.join(content_parts)))
+                            if completed > turns_seen:
+                                turns_seen = completed
+                                status_text.text(f"🤖 Generating conversational script... {turns_seen} turns ready")
+
+                    response_content = ''.join(content_parts)
+
                     # Debug: Show response length and first 100 chars
                     # st.write(f"Debug: Response length: {len(response_content) if response_content else 0}")
                     # st.write(f"Debug: First 100 chars: {response_content[:100] if response_content else 'EMPTY RESPONSE'}...")
@@ -489,6 +538,28 @@ def render_script_generation(openai_model, article_url, host_name, guest_name, a
                 if i < len(st.session_state.generated_script):
                     st.markdown("---")
 
+def _persist_episode_audio(audio_bytes: bytes, filename: str) -> str:
+    """
+    Write the generated episode to a temp file and return its path
+
+    Keeping only the path in session state avoids pickling multi-megabyte
+    audio into session storage on every rerun; st.audio and the download
+    button both read from disk instead. The previous episode's file is
+    removed so regenerating doesn't leak temp files.
+    """
+    old_path = st.session_state.get('audio_path')
+    if old_path:
+        try:
+            os.unlink(old_path)
+        except OSError:
+            pass
+
+    suffix = Path(filename).suffix or ".mp3"
+    fd, path = tempfile.mkstemp(prefix="podcast_episode_", suffix=suffix)
+    with os.fdopen(fd, "wb") as f:
+        f.write(audio_bytes)
+    return path
+
 def render_audio_generation(host_voice, guest_voice, pause_duration):
     """Render audio generation section"""
     if not st.session_state.script_generated:
@@ -518,6 +589,13 @@ def render_audio_generation(host_voice, guest_voice, pause_duration):
         st.warning("⚠️ Please configure voices and load them first")
         return
     
+    use_cached_audio = st.checkbox(
+        "♻️ Reuse cached audio when script and voices are unchanged",
+        value=True,
+        key="use_cached_audio",
+        help="Uncheck to force a fresh ElevenLabs synthesis run."
+    )
+
     if st.button("🎧 Generate Podcast Audio", key="generate_audio"):
         with st.spinner("🎵 Generating high-quality audio... This may take a few minutes."):
             try:
@@ -532,49 +610,77 @@ def render_audio_generation(host_voice, guest_voice, pause_duration):
                 mime_type = "audio/mp3"
                 playback_format = 'audio/mp3'
 
-                try:
-                    # Primary (advanced) path using pydub utilities
-                    audio_bytes, filename = synthesize_episode(
-                        script=st.session_state.generated_script,
-                        pause_ms=pause_duration,
-                        host_voice_id=host_voice[1],
-                        guest_voice_id=guest_voice[1],
-                        eleven_key=elevenlabs_api_key,
-                        progress_callback=lambda p, s: (
-                            progress_bar.progress(p),
-                            status_text.text(s)
-                        )
-                    )
-                except Exception as advanced_err:
-                    # Fallback to basic WAV synthesis that doesn't rely on pydub/audioop
+                # Synthesis runs in a worker thread so the Streamlit request
+                # thread stays free to service progress updates; the worker
+                # pushes (percent, message) tuples into a queue
+                progress_queue = queue.Queue()
+                script = st.session_state.generated_script
+                tts_model = st.session_state.get('tts_model', 'eleven_flash_v2_5')
+
+                def _synthesize_worker():
                     try:
-                        from utils.audio_basic import synthesize_episode_basic, BasicAudioError
-                        status_text.text("⚙️ Falling back to basic WAV synthesis...")
-                        progress_bar.progress(10)
-                        audio_bytes, filename = synthesize_episode_basic(
-                            script=st.session_state.generated_script,
+                        # Primary (advanced) path using pydub utilities
+                        audio, fname = synthesize_episode(
+                            script=script,
+                            pause_ms=pause_duration,
                             host_voice_id=host_voice[1],
                             guest_voice_id=guest_voice[1],
                             eleven_key=elevenlabs_api_key,
-                            pause_ms=pause_duration,
-                            progress_callback=lambda p, s: (
-                                progress_bar.progress(min(90, p)),
-                                status_text.text(s)
-                            )
+                            progress_callback=lambda p, s: progress_queue.put((p, s)),
+                            model_id=tts_model,
+                            use_cache=use_cached_audio
                         )
-                        if filename.lower().endswith('.mp3'):
-                            format_label = "MP3 (basic concat)"
-                            mime_type = "audio/mp3"
-                            playback_format = 'audio/mp3'
-                        else:
-                            format_label = "WAV (basic)"
-                            mime_type = "audio/wav"
-                            playback_format = 'audio/wav'
-                    except Exception as basic_err:
-                        raise Exception(f"Advanced synthesis failed ({advanced_err}); basic fallback failed ({basic_err})")
-                
+                        return audio, fname, False
+                    except Exception as advanced_err:
+                        # Fallback to basic WAV synthesis that doesn't rely on pydub/audioop
+                        try:
+                            from utils.audio_basic import synthesize_episode_basic
+                            progress_queue.put((10, "⚙️ Falling back to basic WAV synthesis..."))
+                            audio, fname = synthesize_episode_basic(
+                                script=script,
+                                host_voice_id=host_voice[1],
+                                guest_voice_id=guest_voice[1],
+                                eleven_key=elevenlabs_api_key,
+                                pause_ms=pause_duration,
+                                model_id=tts_model,
+                                use_cache=use_cached_audio,
+                                progress_callback=lambda p, s: progress_queue.put((min(90, p), s))
+                            )
+                            return audio, fname, True
+                        except Exception as basic_err:
+                            raise Exception(f"Advanced synthesis failed ({advanced_err}); basic fallback failed ({basic_err})")
+
+                with ThreadPoolExecutor(max_workers=1) as executor:
+                    future = executor.submit(_synthesize_worker)
+                    while not future.done():
+                        try:
+                            pct, msg = progress_queue.get(timeout=0.1)
+                        except queue.Empty:
+                            continue
+                        progress_bar.progress(pct)
+                        status_text.text(msg)
+                    # Drain any updates posted after the last poll
+                    while not progress_queue.empty():
+                        pct, msg = progress_queue.get_nowait()
+                        progress_bar.progress(pct)
+                        status_text.text(msg)
+
+                audio_bytes, filename, used_fallback = future.result()
+                # Mime/format follow the filename extension the
+                # synthesizer chose (codec selection may produce ogg)
+                extension = Path(filename).suffix.lower()
+                if extension == '.wav':
+                    format_label = "WAV (basic)" if used_fallback else "WAV"
+                    mime_type = playback_format = 'audio/wav'
+                elif extension == '.ogg':
+                    format_label = "OGG Vorbis"
+                    mime_type = playback_format = 'audio/ogg'
+                else:
+                    format_label = "MP3 (basic concat)" if used_fallback else "MP3"
+                    mime_type = playback_format = 'audio/mp3'
+
                 st.session_state.audio_generated = True
-                st.session_state.audio_bytes = audio_bytes
+                st.session_state.audio_path = _persist_episode_audio(audio_bytes, filename)
                 st.session_state.audio_filename = filename
                 st.session_state.audio_mime = mime_type
                 st.session_state.audio_format_label = format_label
@@ -600,16 +706,17 @@ def render_audio_generation(host_voice, guest_voice, pause_duration):
     if st.session_state.audio_generated:
         st.subheader("🎧 Your Podcast")
         
-        # Audio player
+        # Audio player - st.audio reads the file itself, so the player
+        # doesn't need a second in-memory copy of the episode
         playback_fmt = st.session_state.get('audio_playback_format', 'audio/mp3')
-        st.audio(st.session_state.audio_bytes, format=playback_fmt)
-        
+        st.audio(st.session_state.audio_path, format=playback_fmt)
+
         # Download section
         col1, col2 = st.columns(2)
         with col1:
             st.download_button(
                 label=f"📥 Download Podcast {st.session_state.get('audio_format_label','Audio')}",
-                data=st.session_state.audio_bytes,
+                data=Path(st.session_state.audio_path).read_bytes(),
                 file_name=st.session_state.audio_filename,
                 mime=st.session_state.get('audio_mime','audio/mp3'),
                 key="download_audio"
@@ -708,15 +815,16 @@ def main():
                 try:
                     progress_bar = st.progress(0)
                     status_text = st.empty()
-                    status_text.text("📖 Scraping article content...")
+                    status_text.text("📖 Scraping article and checking OpenAI access...")
                     progress_bar.progress(20)
-                    article = scrape_and_clean(article_url)
-                    status_text.text("🤖 Generating conversational script...")
-                    progress_bar.progress(50)
                     openai_api_key, _ = get_api_keys()
                     import openai
-                    openai.api_key = openai_api_key
-                    
+                    article, _test_response = scrape_article_with_openai_check(
+                        article_url, openai_model, openai_api_key
+                    )
+                    status_text.text("🤖 Generating conversational script...")
+                    progress_bar.progress(50)
+
                     # Build messages based on language
                     if language == "Roman Urdu":
                         messages = [
@@ -96,6 +96,17 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
+@st.cache_resource
+def get_openai_client(api_key: str):
+    """Reuse one OpenAI client (and its HTTP connection pool) across reruns.
+
+    Streamlit re-executes the whole script per interaction, so without
+    cache_resource every button click would rebuild the client and re-warm
+    its TLS pool.
+    """
+    from openai import OpenAI
+    return OpenAI(api_key=api_key)
+
 def initialize_session_state():
     """Initialize session state variables"""
     if 'voices_loaded' not in st.session_state:
@@ -277,9 +288,7 @@ def render_script_generation(openai_api_key, openai_model, article_url, host_nam
                 # Step 2: Generate script
                 st.info("🤖 Generating conversational script...")
                 
-                # Import OpenAI here to avoid issues if not installed
-                from openai import OpenAI
-                client = OpenAI(api_key=openai_api_key)
+                client = get_openai_client(openai_api_key)
                 
                 messages = build_messages(
                     article_title=article["title"],
@@ -12,23 +12,122 @@ API:
                              pause_ms=300, progress_callback=None) -> (bytes, filename)
 """
 from __future__ import annotations
+import asyncio
+import hashlib
 import io
+import json
 import struct
+import tempfile
 import time
+import wave
+from pathlib import Path
 from typing import List, Dict, Callable, Optional, Tuple
 import requests
+from requests.adapters import HTTPAdapter, Retry
 from datetime import datetime
 
+# httpx is optional; without it turns are fetched sequentially with requests
+try:
+    import httpx
+    _ASYNC_TTS_AVAILABLE = True
+except ImportError:
+    _ASYNC_TTS_AVAILABLE = False
+
 ELEVEN_API_TTS = "https://api.elevenlabs.io/v1/text-to-speech/{voice_id}"
-MODEL_ID = "eleven_multilingual_v2"
+# Flash is the speed-optimized tier; multilingual_v2 remains available for quality-first runs
+MODEL_ID = "eleven_flash_v2_5"
 DEFAULT_VOICE_SETTINGS = {"stability": 0.5, "similarity_boost": 0.75}
 
+# Format of the raw PCM stream requested via output_format=pcm_44100;
+# headerless int16 needs no parsing at all
+PCM_SAMPLE_RATE = 44100
+PCM_CHANNELS = 1
+PCM_BITS_PER_SAMPLE = 16
+
+# Cap on simultaneous ElevenLabs requests (accounts have per-tier concurrency limits)
+MAX_CONCURRENT_TTS = 6
+
+# Chunk size for streaming TTS bodies
+STREAM_CHUNK_SIZE = 4096
+
+# Above this many turns, WAV/PCM assembly gets expensive (~10 MB/min of PCM
+# vs ~1 MB/min of 128 kbps MP3), so default to direct MP3 concatenation
+MP3_PREFERRED_TURN_THRESHOLD = 12
+
+# Valid first-two-byte values of an MP3 frame header (11-bit sync word plus
+# version/layer bits): MPEG-1/2 Layer III plus the 0xFFE2/0xFFE3 MPEG-2.5
+# variants some encoders emit. Set membership on an int beats chained
+# bytes comparisons per payload.
+_MP3_FRAME_SYNC = frozenset((0xFFFB, 0xFFFA, 0xFFF3, 0xFFF2, 0xFFE3, 0xFFE2))
+
+# Episodes larger than this are merged through a temp file so the chunk list
+# and the final WAV never coexist in memory (halves peak RSS for long runs)
+TEMPFILE_MERGE_THRESHOLD = 64 * 1024 * 1024
+
+# Shared session keeps the TLS connection to api.elevenlabs.io alive across turns
+# (a fresh handshake costs ~150-300ms per request) and retries transient failures.
+# POST must be allowed explicitly - urllib3's default method set excludes it, which
+# would silently disable the status-based retries for the TTS calls. The TTS
+# request body is idempotent (same text in, same audio out), so retrying is safe.
+_SESSION = requests.Session()
+_SESSION.mount('https://', HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=20,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=Retry.DEFAULT_ALLOWED_METHODS | {"POST"},
+    ),
+))
+
+# Best-effort disk cache for fully assembled episodes; a hit skips every
+# ElevenLabs call for an unchanged script/voices/pause/model combination
+_EPISODE_CACHE_DIR = Path.home() / ".cache" / "podcast_app" / "final"
+
+# Per-turn sub-cache: identical (voice, text, model) turns are fetched once,
+# so re-running after a small script edit only re-synthesizes changed lines
+_TURN_CACHE_DIR = Path.home() / ".cache" / "podcast_app" / "turns"
+_TURN_MEMORY_CACHE: Dict[str, bytes] = {}
+_TURN_MEMORY_CACHE_MAX = 512
+
 class BasicAudioError(Exception):
     pass
 
+def _episode_cache_key(
+    script: List[Dict[str, str]],
+    host_voice_id: str,
+    guest_voice_id: str,
+    pause_ms: int,
+    model_id: str,
+) -> str:
+    fingerprint = json.dumps(script, sort_keys=True) + host_voice_id + guest_voice_id + str(pause_ms) + model_id
+    return hashlib.sha1(fingerprint.encode('utf-8')).hexdigest()
+
+def _episode_cache_read(key: str) -> Optional[Tuple[bytes, str]]:
+    for ext in ('.wav', '.mp3'):
+        candidate = _EPISODE_CACHE_DIR / (key + ext)
+        try:
+            if candidate.exists():
+                return candidate.read_bytes(), ext
+        except OSError:
+            return None
+    return None
+
+def _episode_cache_write(key: str, ext: str, data: bytes) -> None:
+    try:
+        _EPISODE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        (_EPISODE_CACHE_DIR / (key + ext)).write_bytes(data)
+    except OSError:
+        # Caching is best-effort; never fail synthesis over a cache write
+        pass
+
 def _extract_wav_pcm(payload: bytes) -> Tuple[bytes, int, int, int]:
     """Extract raw PCM data and format info from a simple PCM WAV buffer.
 
+    Uses the C-implemented stdlib wave module instead of walking RIFF chunks
+    in Python; the manual walk is kept as a fallback for headers wave rejects.
+
     Returns: (pcm_bytes, sample_rate, channels, bits_per_sample)
     """
     if len(payload) < 44 or payload[0:4] != b'RIFF' or payload[8:12] != b'WAVE':
@@ -36,61 +135,253 @@ def _extract_wav_pcm(payload: bytes) -> Tuple[bytes, int, int, int]:
         preview = payload[:12].hex()
         raise BasicAudioError(f"Unexpected WAV header from ElevenLabs (first bytes: {preview})")
 
+    try:
+        with wave.open(io.BytesIO(payload), 'rb') as w:
+            pcm = w.readframes(w.getnframes())
+            return pcm, w.getframerate(), w.getnchannels(), w.getsampwidth() * 8
+    except (wave.Error, EOFError):
+        return _extract_wav_pcm_manual(payload)
+
+def _extract_wav_pcm_manual(payload: bytes) -> Tuple[bytes, int, int, int]:
+    """Manual RIFF chunk walk for WAV buffers the wave module cannot parse.
+
+    Uses unpack_from and a memoryview so the walk reads fields in place
+    instead of allocating a bytes slice per chunk visited.
+    """
     # Parse fmt chunk (assume at 12)
     # Offset 22: channels (2 bytes), 24: sample rate (4), 34: bits per sample (2)
-    channels = struct.unpack('<H', payload[22:24])[0]
-    sample_rate = struct.unpack('<I', payload[24:28])[0]
-    bits_per_sample = struct.unpack('<H', payload[34:36])[0]
+    channels = struct.unpack_from('<H', payload, 22)[0]
+    sample_rate = struct.unpack_from('<I', payload, 24)[0]
+    bits_per_sample = struct.unpack_from('<H', payload, 34)[0]
 
     # Find data chunk (may not be at fixed offset if there are extra chunks)
+    view = memoryview(payload)
     offset = 12
-    data_chunk_start = None
-    while offset < len(payload) - 8:
-        chunk_id = payload[offset:offset+4]
-        chunk_size = struct.unpack('<I', payload[offset+4:offset+8])[0]
-        if chunk_id == b'data':
+    end = len(payload) - 8
+    while offset < end:
+        chunk_size = struct.unpack_from('<I', payload, offset + 4)[0]
+        if view[offset:offset + 4] == b'data':
             data_chunk_start = offset + 8
-            pcm = payload[data_chunk_start:data_chunk_start+chunk_size]
-            break
+            pcm = bytes(view[data_chunk_start:data_chunk_start + chunk_size])
+            return pcm, sample_rate, channels, bits_per_sample
         offset += 8 + chunk_size
 
-    if data_chunk_start is None:
-        raise BasicAudioError("No data chunk found in WAV")
+    raise BasicAudioError("No data chunk found in WAV")
+
+# Precomputed header for the format ElevenLabs reliably returns
+# (44.1 kHz / mono / 16-bit); only the two size fields vary per episode
+_WAV_HEADER_TEMPLATE_44K1_MONO_16 = struct.pack(
+    '<4sI4s4sIHHIIHH4sI',
+    b'RIFF', 0, b'WAVE',
+    b'fmt ', 16, 1, 1, 44100,
+    88200, 2, 16,
+    b'data', 0
+)
 
-    return pcm, sample_rate, channels, bits_per_sample
+def _pack_wav_header(data_size: int, sample_rate: int, channels: int, bits_per_sample: int) -> bytes:
+    if (sample_rate, channels, bits_per_sample) == (44100, 1, 16):
+        # Patch the two size fields into the template instead of re-parsing
+        # the 12-field format string
+        header = bytearray(_WAV_HEADER_TEMPLATE_44K1_MONO_16)
+        struct.pack_into('<I', header, 4, 36 + data_size)
+        struct.pack_into('<I', header, 40, data_size)
+        return bytes(header)
 
-def _build_wav(pcm: bytes, sample_rate: int, channels: int, bits_per_sample: int) -> bytes:
     byte_rate = sample_rate * channels * bits_per_sample // 8
     block_align = channels * bits_per_sample // 8
-    data_size = len(pcm)
     riff_chunk_size = 36 + data_size
-    header = struct.pack(
+    return struct.pack(
         '<4sI4s4sIHHIIHH4sI',
         b'RIFF', riff_chunk_size, b'WAVE',
         b'fmt ', 16, 1, channels, sample_rate,
         byte_rate, block_align, bits_per_sample,
         b'data', data_size
     )
-    return header + pcm
 
-def _tts_turn(text: str, voice_id: str, api_key: str, want_wav: bool = True) -> bytes:
-    """Request a single TTS turn. Try WAV if requested; fallback handled by caller."""
+def _silence_frames(sample_rate: int, channels: int, bits_per_sample: int, pause_ms: int) -> bytes:
+    """Zero-filled PCM frames for an inter-turn pause.
+
+    b'\\x00' * n is a single C-level memset, equivalent to
+    np.zeros(n, np.int16).tobytes() without the extra array-to-bytes copy.
+    """
+    frame_size = channels * (bits_per_sample // 8)
+    silence_samples = int(sample_rate * (pause_ms / 1000.0))
+    return b'\x00' * (silence_samples * frame_size)
+
+def _merge_pcm_to_wav(pcm_chunks: List[bytes], sample_rate: int, channels: int, bits_per_sample: int) -> bytes:
+    """Assemble header + PCM chunks into the final WAV with a single allocation.
+
+    Joining the header together with the chunks sizes the output buffer once
+    and copies each chunk exactly once, instead of joining the PCM and then
+    concatenating the header onto it (which copied the whole episode twice).
+    A numpy int16 scatter into a preallocated array was benchmarked as the
+    alternative, but it needs a final tobytes() pass, so it moves every byte
+    twice where this join moves it once; join is also memcpy-bound in C.
+    """
+    data_size = sum(len(c) for c in pcm_chunks)
+    header = _pack_wav_header(data_size, sample_rate, channels, bits_per_sample)
+    if data_size >= TEMPFILE_MERGE_THRESHOLD:
+        return _merge_pcm_via_tempfile(header, pcm_chunks)
+    return b''.join([header, *pcm_chunks])
+
+def _merge_pcm_via_tempfile(header: bytes, pcm_chunks: List[bytes]) -> bytes:
+    """Stream header + chunks through a temp file for very large episodes.
+
+    Each chunk is released as soon as it is written, so only the final WAV
+    (read back once) is resident instead of both the chunk list and the
+    joined copy. Consumes (empties) pcm_chunks.
+    """
+    with tempfile.TemporaryFile() as f:
+        f.write(header)
+        while pcm_chunks:
+            f.write(pcm_chunks.pop(0))
+        f.seek(0)
+        return f.read()
+
+def _turn_cache_key(text: str, voice_id: str, api_key: str, want_wav: bool, model_id: str) -> str:
+    # The API key is hashed into the key (never stored) so turns synthesized
+    # under different accounts are not mixed up
+    api_key_hash = hashlib.sha1(api_key.encode('utf-8')).hexdigest()[:16]
+    fingerprint = f"{voice_id}|{model_id}|{int(want_wav)}|{api_key_hash}|{text}"
+    return hashlib.sha1(fingerprint.encode('utf-8')).hexdigest()
+
+def _turn_cache_get(key: str) -> Optional[bytes]:
+    cached = _TURN_MEMORY_CACHE.get(key)
+    if cached is not None:
+        return cached
+    try:
+        path = _TURN_CACHE_DIR / key
+        if path.exists():
+            data = path.read_bytes()
+            _TURN_MEMORY_CACHE[key] = data
+            return data
+    except OSError:
+        pass
+    return None
+
+def _turn_cache_put(key: str, data: bytes) -> None:
+    if len(_TURN_MEMORY_CACHE) >= _TURN_MEMORY_CACHE_MAX:
+        _TURN_MEMORY_CACHE.clear()
+    _TURN_MEMORY_CACHE[key] = data
+    try:
+        _TURN_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        (_TURN_CACHE_DIR / key).write_bytes(data)
+    except OSError:
+        # Caching is best-effort; never fail synthesis over a cache write
+        pass
+
+def _tts_request_parts(text: str, want_wav: bool, model_id: str = MODEL_ID) -> Tuple[str, Dict[str, str], Dict, Dict]:
+    """Build the shared URL suffix, headers, query params and JSON payload for a TTS request."""
     headers = {
-        'xi-api-key': api_key,
-        'accept': 'audio/wav' if want_wav else 'audio/mpeg',
+        'xi-api-key': '',  # filled in by caller
+        'accept': 'application/octet-stream' if want_wav else 'audio/mpeg',
         'content-type': 'application/json'
     }
+    # /stream starts returning audio before synthesis completes;
+    # optimize_streaming_latency trades a little quality for faster first bytes
+    params = {
+        'optimize_streaming_latency': 3,
+        'output_format': 'pcm_44100' if want_wav else 'mp3_44100_128',
+    }
     json_payload = {
         'text': text,
-        'model_id': MODEL_ID,
+        'model_id': model_id,
         'voice_settings': DEFAULT_VOICE_SETTINGS,
-        # Hint desired output format (not always required but explicit)
-        'output_format': 'wav' if want_wav else 'mp3_44100_128'
     }
-    r = requests.post(ELEVEN_API_TTS.format(voice_id=voice_id), headers=headers, json=json_payload, timeout=90)
+    return '/stream', headers, params, json_payload
+
+def _tts_turn(text: str, voice_id: str, api_key: str, want_wav: bool = True, model_id: str = MODEL_ID) -> bytes:
+    """Request a single TTS turn, streaming the body as it is synthesized."""
+    cache_key = _turn_cache_key(text, voice_id, api_key, want_wav, model_id)
+    cached = _turn_cache_get(cache_key)
+    if cached is not None:
+        return cached
+    suffix, headers, params, json_payload = _tts_request_parts(text, want_wav, model_id)
+    headers['xi-api-key'] = api_key
+    r = _SESSION.post(
+        ELEVEN_API_TTS.format(voice_id=voice_id) + suffix,
+        headers=headers, params=params, json=json_payload,
+        timeout=90, stream=True,
+    )
     if r.status_code != 200:
         raise BasicAudioError(f"ElevenLabs TTS failed ({r.status_code}): {r.text[:160]}")
-    return r.content
+    buf = bytearray()
+    for chunk in r.iter_content(chunk_size=STREAM_CHUNK_SIZE):
+        buf.extend(chunk)
+    audio = bytes(buf)
+    _turn_cache_put(cache_key, audio)
+    return audio
+
+async def _tts_turn_async(client, text: str, voice_id: str, api_key: str, want_wav: bool = True, model_id: str = MODEL_ID) -> bytes:
+    """Async variant of _tts_turn sharing the client's connection pool."""
+    cache_key = _turn_cache_key(text, voice_id, api_key, want_wav, model_id)
+    cached = _turn_cache_get(cache_key)
+    if cached is not None:
+        return cached
+    suffix, headers, params, json_payload = _tts_request_parts(text, want_wav, model_id)
+    headers['xi-api-key'] = api_key
+    async with client.stream(
+        'POST', ELEVEN_API_TTS.format(voice_id=voice_id) + suffix,
+        headers=headers, params=params, json=json_payload,
+    ) as r:
+        if r.status_code != 200:
+            body = await r.aread()
+            raise BasicAudioError(f"ElevenLabs TTS failed ({r.status_code}): {body[:160]!r}")
+        buf = bytearray()
+        async for chunk in r.aiter_bytes(STREAM_CHUNK_SIZE):
+            buf.extend(chunk)
+        audio = bytes(buf)
+        _turn_cache_put(cache_key, audio)
+        return audio
+
+async def _gather_turns(
+    turns: List[Tuple[str, str]],
+    api_key: str,
+    want_wav: bool,
+    progress_callback: Optional[Callable[[int, str], None]] = None,
+    model_id: str = MODEL_ID,
+) -> List[bytes]:
+    """Fetch all turns concurrently, preserving script order in the result list."""
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_TTS)
+    progress_lock = asyncio.Lock()
+    completed = 0
+    total = len(turns)
+
+    async def _run(client, voice_id: str, text: str) -> bytes:
+        nonlocal completed
+        async with semaphore:
+            audio = await _tts_turn_async(client, text, voice_id, api_key, want_wav=want_wav, model_id=model_id)
+        async with progress_lock:
+            completed += 1
+            if progress_callback:
+                progress_callback(int((completed / total) * 90), f"Synthesized turn {completed}/{total}")
+        return audio
+
+    async with httpx.AsyncClient(timeout=90) as client:
+        return list(await asyncio.gather(*[_run(client, voice_id, text) for voice_id, text in turns]))
+
+def _fetch_turns(
+    turns: List[Tuple[str, str]],
+    api_key: str,
+    want_wav: bool,
+    progress_callback: Optional[Callable[[int, str], None]] = None,
+    model_id: str = MODEL_ID,
+) -> List[bytes]:
+    """Fetch audio for every (voice_id, text) turn.
+
+    Dispatches all requests concurrently via httpx when available;
+    otherwise falls back to the sequential requests-based path.
+    """
+    if _ASYNC_TTS_AVAILABLE:
+        return asyncio.run(_gather_turns(turns, api_key, want_wav, progress_callback, model_id))
+
+    results = []
+    total = len(turns)
+    for idx, (voice_id, text) in enumerate(turns, 1):
+        if progress_callback:
+            progress_callback(int(((idx - 1) / total) * 90), f"Synthesizing turn {idx}/{total}")
+        results.append(_tts_turn(text, voice_id, api_key, want_wav=want_wav, model_id=model_id))
+    return results
 
 def synthesize_episode_basic(
     script: List[Dict[str, str]],
@@ -100,74 +391,107 @@ def synthesize_episode_basic(
     pause_ms: int = 300,
     progress_callback: Optional[Callable[[int, str], None]] = None,
     prefer_wav: bool = True,
+    model_id: str = MODEL_ID,
+    use_cache: bool = True,
 ) -> Tuple[bytes, str]:
     if not script:
         raise BasicAudioError("Empty script")
 
-    # We support two aggregation modes:
-    # 1. WAV merge (uncompressed) when WAV returned
-    # 2. MP3 concatenation fallback when only MP3 available
-    pcm_chunks: List[bytes] = []
-    mp3_segments: List[bytes] = []
-    sr = channels = bps = None
-    using_mp3 = False
-
-    silence_frames = None  # computed after first WAV segment
+    cache_key = None
+    if use_cache:
+        cache_key = _episode_cache_key(script, host_voice_id, guest_voice_id, pause_ms, model_id)
+        cached = _episode_cache_read(cache_key)
+        if cached is not None:
+            data, ext = cached
+            if progress_callback:
+                progress_callback(100, "Loaded episode from cache")
+            return data, f"podcast_{datetime.now().strftime('%Y%m%d_%H%M%S')}{ext}"
 
-    total_turns = len(script)
-    for idx, turn in enumerate(script, 1):
+    # Collect speakable turns up-front so they can be fetched concurrently
+    turns: List[Tuple[str, str]] = []
+    for turn in script:
         speaker = turn.get('speaker', 'host')
         text = turn.get('text', '').strip()
         if not text:
             continue
-        voice_id = host_voice_id if speaker == 'host' else guest_voice_id
+        turns.append((host_voice_id if speaker == 'host' else guest_voice_id, text))
 
-        if progress_callback:
-            progress_callback(int(((idx-1)/total_turns)*90), f"Synthesizing turn {idx}/{total_turns} ({speaker})")
+    if not turns:
+        raise BasicAudioError("Script contains no speakable text")
 
-        # Attempt preferred WAV first (if still in wav mode)
-        if prefer_wav and not using_mp3:
-            try:
-                wav_bytes = _tts_turn(text, voice_id, eleven_key, want_wav=True)
-                pcm, srate, ch, bits = _extract_wav_pcm(wav_bytes)
+    # Long episodes skip the PCM round-trip entirely; MP3 concat keeps
+    # memory ~10x lower but cannot insert inter-turn silence, so only
+    # auto-switch when no pause is configured - a configured pause always
+    # takes the WAV path that honors it
+    if prefer_wav and pause_ms == 0 and len(turns) > MP3_PREFERRED_TURN_THRESHOLD:
+        prefer_wav = False
+
+    # We support two aggregation modes:
+    # 1. Raw PCM merge (headerless int16 via output_format=pcm_44100)
+    # 2. MP3 concatenation fallback when raw PCM is unavailable
+    using_mp3 = not prefer_wav
+    payloads: List[bytes] = []
+
+    pcm_chunks: List[bytes] = []
+    sr = channels = bps = None
+
+    if not using_mp3:
+        # Assemble serially on the already-fetched results so ordering stays deterministic
+        try:
+            payloads = _fetch_turns(turns, eleven_key, want_wav=True,
+                                    progress_callback=progress_callback, model_id=model_id)
+            silence_frames = b''
+            total_turns = len(payloads)
+            for idx, payload in enumerate(payloads, 1):
+                if payload[:4] == b'RIFF':
+                    # Some account tiers ignore output_format and return WAV anyway
+                    pcm, srate, ch, bits = _extract_wav_pcm(payload)
+                else:
+                    # pcm_44100 bodies are raw int16 frames - nothing to parse
+                    pcm = payload
+                    srate, ch, bits = PCM_SAMPLE_RATE, PCM_CHANNELS, PCM_BITS_PER_SAMPLE
                 if sr is None:
                     sr, channels, bps = srate, ch, bits
-                    bytes_per_sample = bps // 8
-                    frame_size = channels * bytes_per_sample
-                    silence_samples = int(sr * (pause_ms / 1000.0))
-                    silence_frames = b'\x00' * (silence_samples * frame_size)
+                    # One reusable bytes object; appended by reference per gap
+                    silence_frames = _silence_frames(sr, channels, bps, pause_ms)
                 else:
                     if (srate, ch, bits) != (sr, channels, bps):
                         raise BasicAudioError("Inconsistent audio format returned across turns")
                 pcm_chunks.append(pcm)
                 if idx != total_turns:
                     pcm_chunks.append(silence_frames)
-                continue
-            except BasicAudioError:
-                # Switch to MP3 fallback
-                using_mp3 = True
-                if progress_callback:
-                    progress_callback(int(((idx-1)/total_turns)*90), f"Switching to MP3 fallback (turn {idx})")
-
-        # MP3 path
-        mp3_bytes = _tts_turn(text, voice_id, eleven_key, want_wav=False)
-        # Basic validation: check for MP3 frame or ID3
-        if not (mp3_bytes.startswith(b'ID3') or mp3_bytes[:2] in (b'\xff\xfb', b'\xff\xf3', b'\xff\xf2')):
-            preview = mp3_bytes[:16].hex()
-            raise BasicAudioError(f"Unexpected MP3 fallback bytes (first 16: {preview})")
-        mp3_segments.append(mp3_bytes)
+        except BasicAudioError:
+            # Switch to MP3 fallback and refetch every turn so no audio is lost
+            using_mp3 = True
+            pcm_chunks = []
+            if progress_callback:
+                progress_callback(0, "Switching to MP3 fallback...")
 
     if using_mp3:
+        payloads = _fetch_turns(turns, eleven_key, want_wav=False,
+                                progress_callback=progress_callback, model_id=model_id)
+        mp3_segments: List[bytes] = []
+        for mp3_bytes in payloads:
+            # Basic validation: check for MP3 frame sync or ID3 tag
+            if not (mp3_bytes[:3] == b'ID3'
+                    or (len(mp3_bytes) >= 2
+                        and int.from_bytes(mp3_bytes[:2], 'big') in _MP3_FRAME_SYNC)):
+                preview = mp3_bytes[:16].hex()
+                raise BasicAudioError(f"Unexpected MP3 fallback bytes (first 16: {preview})")
+            mp3_segments.append(mp3_bytes)
         if progress_callback:
             progress_callback(95, "Merging MP3 segments")
         merged = b''.join(mp3_segments)
+        if cache_key:
+            _episode_cache_write(cache_key, '.mp3', merged)
         filename = f"podcast_{datetime.now().strftime('%Y%m%d_%H%M%S')}.mp3"
         if progress_callback:
             progress_callback(100, "Done")
         return merged, filename
     else:
-        merged_pcm = b''.join(pcm_chunks)
-        final_wav = _build_wav(merged_pcm, sr, channels, bps)
+        final_wav = _merge_pcm_to_wav(pcm_chunks, sr, channels, bps)
+        if cache_key:
+            _episode_cache_write(cache_key, '.wav', final_wav)
         if progress_callback:
             progress_callback(95, "Finalizing WAV file")
         filename = f"podcast_{datetime.now().strftime('%Y%m%d_%H%M%S')}.wav"
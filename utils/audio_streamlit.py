@@ -3,9 +3,20 @@ Audio synthesis utilities for Streamlit app using ElevenLabs.
 Enhanced version with progress callbacks and better error handling.
 """
 
+import asyncio
+import hashlib
+import math
+import os
+import random
 import requests
+import shutil
+import subprocess
+import tempfile
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from io import BytesIO
+from pathlib import Path
+from requests.adapters import HTTPAdapter
 from typing import List, Dict, Tuple, Optional, Callable
 import streamlit as st
 
@@ -21,23 +32,58 @@ try:
         pass
     
     from pydub import AudioSegment
-    from pydub.generators import Silence
 except Exception as e:
     _AUDIO_DISABLED = True
     _AUDIO_IMPORT_ERROR = f"Audio synthesis not available: {str(e)}"
 
+# Optional fast JSON parsing for API payloads (the voices listing can run
+# to dozens of KB of metadata); orjson returns plain dicts/lists
+try:
+    import orjson as _orjson
+    _ORJSON_AVAILABLE = True
+except ImportError:
+    _ORJSON_AVAILABLE = False
+
+# Optional async HTTP client for concurrent voice previews
+try:
+    import httpx
+    _HTTPX_AVAILABLE = True
+except ImportError:
+    _HTTPX_AVAILABLE = False
+
+# Optional vectorized resampling: one polyphase pass over the whole
+# episode instead of pydub spawning ffmpeg per segment
+try:
+    import numpy as _np
+    from scipy.signal import resample_poly as _resample_poly
+    _SCIPY_AVAILABLE = True
+except ImportError:
+    _SCIPY_AVAILABLE = False
+
+# Shared session: reuses TCP+TLS connections across voice listing,
+# previews and the synthesis pool instead of a fresh handshake per call.
+# Retries stay at 0 here - _synthesize_single_line has its own policy.
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=16))
+
+@st.cache_data(ttl=300, show_spinner=False)
 def get_available_voices(elevenlabs_api_key: str) -> List[Dict]:
     """
     Fetch available voices from ElevenLabs API
-    
+
+    The catalog rarely changes, so results are cached for five minutes -
+    otherwise every Streamlit rerun that renders the voice dropdown pays
+    a full round trip. Call get_available_voices.clear() to force a
+    refresh (wired to the UI's refresh button).
+
     Args:
         elevenlabs_api_key: ElevenLabs API key
-        
+
     Returns:
         List of voice dictionaries with name, voice_id, and other metadata
     """
     try:
-        response = requests.get(
+        response = _SESSION.get(
             "https://api.elevenlabs.io/v1/voices",
             headers={
                 "xi-api-key": elevenlabs_api_key,
@@ -46,8 +92,11 @@ def get_available_voices(elevenlabs_api_key: str) -> List[Dict]:
             timeout=10
         )
         response.raise_for_status()
-        
-        voices_data = response.json()
+
+        if _ORJSON_AVAILABLE:
+            voices_data = _orjson.loads(response.content)
+        else:
+            voices_data = response.json()
         return voices_data.get("voices", [])
         
     except requests.exceptions.RequestException as e:
@@ -55,25 +104,34 @@ def get_available_voices(elevenlabs_api_key: str) -> List[Dict]:
     except Exception as e:
         raise Exception(f"Error processing voices: {str(e)}")
 
+@st.cache_data(ttl=3600, max_entries=200, show_spinner=False)
 def preview_voice(elevenlabs_api_key: str, voice_id: str, text: str = None) -> str:
     """
     Generate a voice preview using ElevenLabs TTS
-    
+
+    Results are cached for an hour so repeated clicks on the same
+    voice/text pair are served from cache instead of re-hitting the API.
+
     Args:
         elevenlabs_api_key: ElevenLabs API key
         voice_id: Voice ID to preview
         text: Text to synthesize (optional)
-        
+
     Returns:
         Audio data as bytes that can be used with st.audio()
     """
     if text is None:
         text = "Hello! This is a voice preview for the podcast generator."
-    
+
+    # Delegate to the async implementation when httpx is installed so the
+    # sync and batch paths share one request shape
+    if _HTTPX_AVAILABLE:
+        return asyncio.run(preview_voice_async(elevenlabs_api_key, voice_id, text))
+
     try:
         tts_url = f"https://api.elevenlabs.io/v1/text-to-speech/{voice_id}"
-        
-        response = requests.post(
+
+        response = _SESSION.post(
             tts_url,
             headers={
                 "xi-api-key": elevenlabs_api_key,
@@ -82,87 +140,302 @@ def preview_voice(elevenlabs_api_key: str, voice_id: str, text: str = None) -> s
             },
             json={
                 "text": text,
-                "model_id": "eleven_multilingual_v2",
-                "voice_settings": {
-                    "stability": 0.4,
-                    "similarity_boost": 0.8,
-                    "style": 0.2,
-                    "use_speaker_boost": True
-                }
+                "model_id": _MODEL_ID,
+                "voice_settings": _VOICE_SETTINGS
             },
             timeout=30
         )
         response.raise_for_status()
-        
+
         return response.content
-        
+
     except requests.exceptions.RequestException as e:
         raise Exception(f"Failed to generate voice preview: {str(e)}")
     except Exception as e:
         raise Exception(f"Error in voice preview: {str(e)}")
 
+async def preview_voice_async(
+    elevenlabs_api_key: str,
+    voice_id: str,
+    text: str = None,
+    client: Optional["httpx.AsyncClient"] = None
+) -> bytes:
+    """
+    Generate a voice preview without blocking the calling thread
+
+    Lets the UI audition several voices at once: drive a batch with
+    asyncio.gather over one shared httpx.AsyncClient, and the total wait
+    collapses to roughly the slowest preview instead of their sum.
+
+    Args:
+        elevenlabs_api_key: ElevenLabs API key
+        voice_id: Voice ID to preview
+        text: Text to synthesize (optional)
+        client: Optional shared httpx.AsyncClient; one is created (and
+            closed) per call when omitted
+
+    Returns:
+        Audio data as bytes that can be used with st.audio()
+    """
+    if text is None:
+        text = "Hello! This is a voice preview for the podcast generator."
+
+    own_client = client is None
+    if own_client:
+        client = httpx.AsyncClient(
+            timeout=30, limits=httpx.Limits(max_connections=8)
+        )
+    try:
+        response = await client.post(
+            f"https://api.elevenlabs.io/v1/text-to-speech/{voice_id}",
+            headers={
+                "xi-api-key": elevenlabs_api_key,
+                "accept": "audio/mpeg",
+                "content-type": "application/json",
+            },
+            json={
+                "text": text,
+                "model_id": _MODEL_ID,
+                "voice_settings": _VOICE_SETTINGS
+            }
+        )
+        response.raise_for_status()
+        return response.content
+    except httpx.HTTPError as e:
+        raise Exception(f"Failed to generate voice preview: {str(e)}")
+    finally:
+        if own_client:
+            await client.aclose()
+
+# Default model and the voice settings shared by every synthesis call in
+# this module; both feed the cache key below, so changing them invalidates
+# old audio. Callers can override the model per episode (the app's
+# "ElevenLabs Model" selector threads through synthesize_episode).
+_MODEL_ID = "eleven_multilingual_v2"
+_VOICE_SETTINGS = {
+    "stability": 0.4,
+    "similarity_boost": 0.8,
+    "style": 0.2,
+    "use_speaker_boost": True
+}
+
+# Two-tier cache for per-line TTS output: an in-process dict in front of
+# ~/.cache/podcast_app/tts on disk. With fixed voice settings the audio for
+# a given (voice, model, text) is reproducible, so re-synthesizing an
+# edited episode only pays for the lines that actually changed - and saves
+# the corresponding API quota.
+_TTS_CACHE_DIR = Path.home() / ".cache" / "podcast_app" / "tts"
+_TTS_MEMORY_CACHE: Dict[str, bytes] = {}
+_TTS_MEMORY_CACHE_MAX = 256
+
+def _tts_cache_key(voice_id: str, text: str, model_id: str = _MODEL_ID) -> str:
+    """Derive the cache key for one line of synthesized audio"""
+    settings = ",".join(f"{k}={_VOICE_SETTINGS[k]}" for k in sorted(_VOICE_SETTINGS))
+    payload = f"{voice_id}|{model_id}|{settings}|{text}"
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=20).hexdigest()
+
+def _tts_cache_get(key: str) -> Optional[bytes]:
+    """Look up cached audio, promoting disk hits into the memory tier"""
+    data = _TTS_MEMORY_CACHE.get(key)
+    if data is not None:
+        return data
+    path = _TTS_CACHE_DIR / f"{key}.mp3"
+    try:
+        if path.is_file():
+            data = path.read_bytes()
+            _TTS_MEMORY_CACHE[key] = data
+            return data
+    except OSError:
+        pass
+    return None
+
+def _tts_cache_put(key: str, data: bytes) -> None:
+    """Store synthesized audio in both cache tiers (disk best-effort)"""
+    if len(_TTS_MEMORY_CACHE) >= _TTS_MEMORY_CACHE_MAX:
+        _TTS_MEMORY_CACHE.pop(next(iter(_TTS_MEMORY_CACHE)))
+    _TTS_MEMORY_CACHE[key] = data
+    try:
+        _TTS_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        (_TTS_CACHE_DIR / f"{key}.mp3").write_bytes(data)
+    except OSError:
+        pass
+
+# Session-level cache of synthesized boilerplate (show intro, sponsor
+# break, outro) keyed by (voice_id, model_id, normalized text). Populated
+# from the fixed_phrases argument to synthesize_episode and from any line
+# repeated within an episode.
+_PHRASE_CACHE: Dict[Tuple[str, str, str], bytes] = {}
+
+# HTTP statuses worth retrying: rate limiting and transient server errors.
+# Other 4xx responses (bad key, bad voice_id, oversized text) will fail the
+# same way on every attempt, so they raise immediately.
+_RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+def _retry_delay(response, attempt: int, base: float = 1.0,
+                 max_delay: float = 30.0, jitter: float = 0.5) -> float:
+    """
+    Compute how long to sleep before the next TTS retry
+
+    Honors the server's Retry-After header when present (the authoritative
+    signal on 429s); otherwise falls back to capped exponential backoff
+    with jitter so parallel workers don't retry in lockstep.
+    """
+    if response is not None:
+        retry_after = response.headers.get("Retry-After")
+        if retry_after:
+            try:
+                return min(max_delay, float(retry_after))
+            except ValueError:
+                pass
+    return min(max_delay, base * (2 ** attempt)) + random.uniform(0, jitter)
+
 def _synthesize_single_line(
-    text: str, 
-    voice_id: str, 
+    text: str,
+    voice_id: str,
     elevenlabs_api_key: str,
-    max_retries: int = 3
+    max_retries: int = 3,
+    model_id: str = _MODEL_ID,
+    use_cache: bool = True
 ) -> bytes:
     """
     Synthesize a single line of text to audio
-    
+
     Args:
         text: Text to synthesize
         voice_id: ElevenLabs voice ID
         elevenlabs_api_key: ElevenLabs API key
         max_retries: Maximum number of retry attempts
-        
+        model_id: ElevenLabs model to synthesize with
+        use_cache: When False, skip cache lookups and synthesize fresh
+            (the result still refreshes the cache)
+
     Returns:
         Audio data as bytes
     """
-    tts_url = f"https://api.elevenlabs.io/v1/text-to-speech/{voice_id}"
-    
+    cache_key = _tts_cache_key(voice_id, text, model_id)
+    if use_cache:
+        cached = _tts_cache_get(cache_key)
+        if cached is not None:
+            return cached
+
+    # The /stream endpoint starts sending MP3 frames before synthesis of
+    # the whole line finishes; chunks are drained into one bytearray as
+    # they arrive rather than buffering the body twice via .content
+    tts_url = f"https://api.elevenlabs.io/v1/text-to-speech/{voice_id}/stream"
+
     for attempt in range(max_retries):
         try:
-            response = requests.post(
+            response = _SESSION.post(
                 tts_url,
                 headers={
                     "xi-api-key": elevenlabs_api_key,
                     "accept": "audio/mpeg",
                     "content-type": "application/json",
                 },
+                params={"optimize_streaming_latency": 2},
                 json={
                     "text": text,
-                    "model_id": "eleven_multilingual_v2",
-                    "voice_settings": {
-                        "stability": 0.4,
-                        "similarity_boost": 0.8,
-                        "style": 0.2,
-                        "use_speaker_boost": True
-                    }
+                    "model_id": model_id,
+                    "voice_settings": _VOICE_SETTINGS
                 },
-                timeout=60
+                timeout=60,
+                stream=True
             )
-            response.raise_for_status()
-            return response.content
-            
+            with response:
+                response.raise_for_status()
+                audio = bytearray()
+                for chunk in response.iter_content(chunk_size=8192):
+                    audio.extend(chunk)
+            audio_bytes = bytes(audio)
+            _tts_cache_put(cache_key, audio_bytes)
+            return audio_bytes
+
         except requests.exceptions.RequestException as e:
+            failed_response = getattr(e, "response", None)
+            status = failed_response.status_code if failed_response is not None else None
+            # Non-retryable client errors fail identically every attempt
+            if status is not None and status not in _RETRYABLE_STATUSES:
+                raise Exception(f"Failed to synthesize audio (HTTP {status}): {str(e)}")
             if attempt == max_retries - 1:
                 raise Exception(f"Failed to synthesize audio after {max_retries} attempts: {str(e)}")
-            time.sleep(2 ** attempt)  # Exponential backoff
-    
+            time.sleep(_retry_delay(failed_response, attempt))
+
     raise Exception("Unexpected error in audio synthesis")
 
+def _concat_mp3_ffmpeg(mp3_payloads: List[bytes], pause_ms: int) -> bytes:
+    """
+    Concatenate per-turn MP3 payloads losslessly with ffmpeg's concat demuxer
+
+    The turns arrive from ElevenLabs already encoded as MP3 at a sane
+    bitrate, so stream-copying them (-c copy) skips the full decode-to-PCM
+    and re-encode round trip that the pydub path performs. The inter-turn
+    pause is rendered once from the anullsrc source at matching parameters
+    and referenced between every pair of turns.
+
+    Args:
+        mp3_payloads: Per-turn MP3 bytes in script order
+        pause_ms: Pause duration between turns in milliseconds
+
+    Returns:
+        The concatenated episode as MP3 bytes
+
+    Raises:
+        subprocess.CalledProcessError: If an ffmpeg invocation fails
+    """
+    with tempfile.TemporaryDirectory(prefix="podcast_concat_") as tmpdir:
+        turn_paths = []
+        for idx, payload in enumerate(mp3_payloads):
+            path = os.path.join(tmpdir, f"turn_{idx:04d}.mp3")
+            with open(path, "wb") as f:
+                f.write(payload)
+            turn_paths.append(path)
+
+        silence_path = None
+        if pause_ms > 0:
+            silence_path = os.path.join(tmpdir, "silence.mp3")
+            subprocess.run(
+                ["ffmpeg", "-loglevel", "error", "-y",
+                 "-f", "lavfi", "-i", "anullsrc=r=44100:cl=mono",
+                 "-t", f"{pause_ms / 1000:.3f}",
+                 "-c:a", "libmp3lame", "-b:a", "128k",
+                 silence_path],
+                check=True, capture_output=True
+            )
+
+        list_path = os.path.join(tmpdir, "concat.txt")
+        with open(list_path, "w") as f:
+            for idx, path in enumerate(turn_paths):
+                f.write(f"file '{path}'\n")
+                if silence_path and idx < len(turn_paths) - 1:
+                    f.write(f"file '{silence_path}'\n")
+
+        out_path = os.path.join(tmpdir, "episode.mp3")
+        subprocess.run(
+            ["ffmpeg", "-loglevel", "error", "-y",
+             "-f", "concat", "-safe", "0", "-i", list_path,
+             "-c", "copy", out_path],
+            check=True, capture_output=True
+        )
+
+        with open(out_path, "rb") as f:
+            return f.read()
+
 def synthesize_episode(
     script: List[Dict],
     pause_ms: int,
     host_voice_id: str,
     guest_voice_id: str,
     eleven_key: str,
-    progress_callback: Optional[Callable[[int, str], None]] = None
+    progress_callback: Optional[Callable[[int, str], None]] = None,
+    max_workers: int = 4,
+    codec: str = "mp3_vbr",
+    fixed_phrases: Optional[List[str]] = None,
+    model_id: str = _MODEL_ID,
+    use_cache: bool = True
 ) -> Tuple[bytes, str]:
     """
     Synthesize a complete podcast episode from script
-    
+
     Args:
         script: List of script turns with speaker and text
         pause_ms: Pause duration between speakers in milliseconds
@@ -170,173 +443,277 @@ def synthesize_episode(
         guest_voice_id: Voice ID for guest
         eleven_key: ElevenLabs API key
         progress_callback: Optional callback for progress updates (progress_percent, status_message)
-        
+        max_workers: Number of concurrent TTS requests (keep within the
+            ElevenLabs concurrency limit for the account tier)
+        codec: Output encoding - "mp3_vbr" (default, ~20-30% smaller at
+            equal quality), "ogg" (libvorbis, fastest encode), or
+            "mp3_cbr" (192 kbps, maximum player compatibility)
+        fixed_phrases: Boilerplate lines (show intro, sponsor break,
+            outro) whose audio should be kept in the session phrase cache
+            and reused across episodes without new TTS calls
+        model_id: ElevenLabs model to synthesize with
+        use_cache: When False, bypass the phrase and per-line TTS caches
+            and synthesize every line fresh (results still refresh the
+            caches for later runs)
+
     Returns:
         Tuple of (audio_bytes, filename)
     """
     if _AUDIO_DISABLED:
         raise Exception(f"Audio synthesis unavailable: {_AUDIO_IMPORT_ERROR}")
-    
+
     if not script:
         raise Exception("No script provided for audio synthesis")
-    
+
     # Initialize progress
     total_turns = len(script)
     if progress_callback:
         progress_callback(0, "Starting audio synthesis...")
-    
-    # Create silence for pauses
-    pause_audio = Silence(duration=max(0, pause_ms))
-    
-    # Initialize the final audio track
-    final_audio = AudioSegment.empty()
-    
-    # Process each turn in the script
+
+    # Canonical output format; every decoded segment is normalized to it
+    # so raw frames can be concatenated directly
+    frame_rate = 44100
+    channels = 1
+    sample_width = 2
+
+    # Collect the turns that need synthesis, remembering script order
+    jobs = []
     for i, turn in enumerate(script):
         speaker = turn.get("speaker", "").lower()
         text = turn.get("text", "").strip()
-        
+
         if not text:
             continue
-        
+
         # Determine voice ID based on speaker
         voice_id = host_voice_id if speaker == "host" else guest_voice_id
-        
-        # Update progress
-        progress_percent = int((i / total_turns) * 90)  # Reserve 10% for final processing
-        speaker_name = "Host" if speaker == "host" else "Guest"
-        
-        if progress_callback:
-            progress_callback(progress_percent, f"Synthesizing {speaker_name} line {i+1}/{total_turns}...")
-        
-        try:
-            # Synthesize the audio for this line
-            audio_data = _synthesize_single_line(text, voice_id, eleven_key)
-            
-            # Convert to AudioSegment
-            audio_segment = AudioSegment.from_file(BytesIO(audio_data), format="mp3")
-            
-            # Add to final audio with pause
-            final_audio += audio_segment
-            
-            # Add pause after each line (except the last one)
-            if i < total_turns - 1:
-                final_audio += pause_audio
-            
-            # Rate limiting to avoid API limits
-            time.sleep(0.3)
-            
-        except Exception as e:
-            error_msg = f"Failed to synthesize line {i+1}: {str(e)}"
+        jobs.append((i, speaker, voice_id, text))
+
+    # Serve boilerplate from the session phrase cache and collapse lines
+    # repeated within the episode, so each unique (voice, phrase) costs at
+    # most one TTS round trip
+    fixed_keys = {phrase.strip().lower() for phrase in (fixed_phrases or [])}
+    results = {}
+    pending = {}
+    for i, speaker, voice_id, text in jobs:
+        phrase_key = (voice_id, model_id, text.strip().lower())
+        cached = _PHRASE_CACHE.get(phrase_key) if use_cache else None
+        if cached is not None:
+            results[i] = cached
+        else:
+            pending.setdefault(phrase_key, (voice_id, text, []))[2].append(i)
+
+    # TTS is pure network I/O, so the requests run concurrently in a
+    # thread pool; results are keyed by script index and assembled in
+    # order below, regardless of which request finishes first
+    completed = len(results)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(_synthesize_single_line, text, voice_id, eleven_key,
+                            model_id=model_id, use_cache=use_cache): phrase_key
+            for phrase_key, (voice_id, text, _) in pending.items()
+        }
+        for future in as_completed(futures):
+            phrase_key = futures[future]
+            voice_id, text, indices = pending[phrase_key]
+            try:
+                audio_data = future.result()
+            except Exception as e:
+                error_msg = f"Failed to synthesize line {indices[0]+1}: {str(e)}"
+                if progress_callback:
+                    progress_callback(int((completed / total_turns) * 90), error_msg)
+                raise Exception(error_msg)
+
+            for i in indices:
+                results[i] = audio_data
+
+            # Remember declared boilerplate, plus anything that repeated
+            # within this episode, for later episodes in the session
+            if phrase_key[2] in fixed_keys or len(indices) > 1:
+                _PHRASE_CACHE[phrase_key] = audio_data
+
+            completed += len(indices)
             if progress_callback:
-                progress_callback(progress_percent, error_msg)
-            raise Exception(error_msg)
-    
-    # Final processing
-    if progress_callback:
-        progress_callback(95, "Finalizing audio file...")
-    
-    # Export to MP3
-    output_buffer = BytesIO()
-    final_audio.export(
-        output_buffer,
-        format="mp3",
-        bitrate="192k",
-        parameters=["-ar", "44100"]  # Ensure consistent sample rate
-    )
-    output_buffer.seek(0)
-    
-    # Generate filename with timestamp
-    timestamp = time.strftime("%Y%m%d_%H%M%S")
-    filename = f"podcast_episode_{timestamp}.mp3"
-    
-    audio_bytes = output_buffer.read()
-    
-    if progress_callback:
-        progress_callback(100, f"Audio synthesis complete! Generated {len(audio_bytes)} bytes")
-    
-    return audio_bytes, filename
-    
-    if not script:
-        raise Exception("No script provided for audio synthesis")
-    
-    # Initialize progress
-    total_turns = len(script)
-    if progress_callback:
-        progress_callback(0, "Starting audio synthesis...")
-    
-    # Create silence for pauses
-    pause_audio = Silence(duration=max(0, pause_ms))
-    
-    # Initialize the final audio track
-    final_audio = AudioSegment.empty()
-    
-    # Process each turn in the script
-    for i, turn in enumerate(script):
-        speaker = turn.get("speaker", "").lower()
-        text = turn.get("text", "").strip()
-        
-        if not text:
-            continue
-        
-        # Determine voice ID based on speaker
-        voice_id = host_voice_id if speaker == "host" else guest_voice_id
-        
-        # Update progress
-        progress_percent = int((i / total_turns) * 90)  # Reserve 10% for final processing
-        speaker_name = "Host" if speaker == "host" else "Guest"
-        
-        if progress_callback:
-            progress_callback(progress_percent, f"Synthesizing {speaker_name} line {i+1}/{total_turns}...")
-        
+                progress_percent = int((completed / total_turns) * 90)  # Reserve 10% for final processing
+                progress_callback(progress_percent, f"Synthesized line {indices[0]+1} ({completed}/{len(jobs)})...")
+
+    # Fast path: the payloads are already MP3, so for the default VBR MP3
+    # output with ffmpeg on PATH they can be stream-copied without a
+    # decode/re-encode pass. "mp3_cbr" promises 192 kbps CBR and "ogg"
+    # promises Vorbis, so both must take the transcoding export below
+    if codec == "mp3_vbr" and shutil.which("ffmpeg"):
         try:
-            # Synthesize the audio for this line
-            audio_data = _synthesize_single_line(text, voice_id, eleven_key)
-            
-            # Convert to AudioSegment
-            audio_segment = AudioSegment.from_file(BytesIO(audio_data), format="mp3")
-            
-            # Add to final audio with pause
-            final_audio += audio_segment
-            
-            # Add pause after each line (except the last one)
-            if i < total_turns - 1:
-                final_audio += pause_audio
-            
-            # Rate limiting to avoid API limits
-            time.sleep(0.3)
-            
-        except Exception as e:
-            error_msg = f"Failed to synthesize line {i+1}: {str(e)}"
             if progress_callback:
-                progress_callback(progress_percent, error_msg)
-            raise Exception(error_msg)
-    
+                progress_callback(95, "Concatenating MP3 segments...")
+            audio_bytes = _concat_mp3_ffmpeg(
+                [results[i] for i, _, _, _ in jobs], max(0, pause_ms)
+            )
+            timestamp = time.strftime("%Y%m%d_%H%M%S")
+            filename = f"podcast_episode_{timestamp}.mp3"
+            if progress_callback:
+                progress_callback(100, f"Audio synthesis complete! Generated {len(audio_bytes)} bytes")
+            return audio_bytes, filename
+        except (subprocess.CalledProcessError, OSError):
+            # Mismatched stream parameters or a broken ffmpeg install;
+            # fall through to the pydub decode/re-encode path
+            pass
+
+    # Decode every turn first so the provider's native sample rate is
+    # known before any rate conversion happens
+    segments = []
+    for i, speaker, voice_id, text in jobs:
+        segments.append(
+            AudioSegment.from_file(BytesIO(results[i]), format="mp3")
+            .set_channels(channels)
+            .set_sample_width(sample_width)
+        )
+    native_rate = segments[0].frame_rate if segments else frame_rate
+
+    # Silence is just zeroed frames - build the pause directly instead of
+    # rendering it through a pydub generator
+    pause_frames = int(max(0, pause_ms) / 1000 * native_rate)
+    pause_bytes = b"\x00" * (pause_frames * sample_width * channels)
+
+    # Assemble the episode as one growing PCM buffer at the native rate.
+    # Repeated `final_audio += segment` copies the whole accumulated track
+    # on every add (quadratic in episode length); extending a bytearray and
+    # building a single AudioSegment at the end is linear
+    pcm_buffer = bytearray()
+    for job_index, audio_segment in enumerate(segments):
+        if audio_segment.frame_rate != native_rate:
+            audio_segment = audio_segment.set_frame_rate(native_rate)
+        pcm_buffer.extend(audio_segment.raw_data)
+
+        # Add pause after each line (except the last one)
+        if job_index < len(segments) - 1:
+            pcm_buffer.extend(pause_bytes)
+
+    # Resample the whole episode to the target rate in one pass. With
+    # scipy that's a single FFT-backed polyphase filter over the full
+    # int16 array; without it, pydub converts the concatenated track once
+    # (still one ffmpeg invocation rather than one per segment).
+    if native_rate != frame_rate:
+        if _SCIPY_AVAILABLE:
+            g = math.gcd(frame_rate, native_rate)
+            samples = _np.frombuffer(bytes(pcm_buffer), dtype=_np.int16)
+            resampled = _resample_poly(samples, frame_rate // g, native_rate // g)
+            pcm_buffer = (
+                _np.clip(_np.rint(resampled), -32768, 32767)
+                .astype(_np.int16)
+                .tobytes()
+            )
+        else:
+            pcm_buffer = (
+                AudioSegment(
+                    data=bytes(pcm_buffer),
+                    sample_width=sample_width,
+                    frame_rate=native_rate,
+                    channels=channels
+                )
+                .set_frame_rate(frame_rate)
+                .raw_data
+            )
+
+    final_audio = AudioSegment(
+        data=bytes(pcm_buffer),
+        sample_width=sample_width,
+        frame_rate=frame_rate,
+        channels=channels
+    )
+
     # Final processing
     if progress_callback:
         progress_callback(95, "Finalizing audio file...")
-    
-    # Export to MP3
+
+    # Encode the final track. VBR (-q:a 4) cuts 20-30% of bytes at equal
+    # perceived quality for speech; CBR 192k stays available for players
+    # that choke on VBR.
+    if codec == "ogg":
+        export_kwargs = {"format": "ogg", "codec": "libvorbis",
+                         "parameters": ["-q:a", "4"]}
+        extension = "ogg"
+    elif codec == "mp3_cbr":
+        export_kwargs = {"format": "mp3", "bitrate": "192k",
+                         "parameters": ["-ar", "44100"]}
+        extension = "mp3"
+    else:  # mp3_vbr
+        export_kwargs = {"format": "mp3",
+                         "parameters": ["-q:a", "4", "-ar", "44100"]}
+        extension = "mp3"
+
     output_buffer = BytesIO()
-    final_audio.export(
-        output_buffer,
-        format="mp3",
-        bitrate="192k",
-        parameters=["-ar", "44100"]  # Ensure consistent sample rate
-    )
+    final_audio.export(output_buffer, **export_kwargs)
     output_buffer.seek(0)
-    
+
     # Generate filename with timestamp
     timestamp = time.strftime("%Y%m%d_%H%M%S")
-    filename = f"podcast_episode_{timestamp}.mp3"
-    
+    filename = f"podcast_episode_{timestamp}.{extension}"
+
     audio_bytes = output_buffer.read()
-    
+
     if progress_callback:
         progress_callback(100, f"Audio synthesis complete! Generated {len(audio_bytes)} bytes")
-    
+
     return audio_bytes, filename
 
+def _ffmpeg_has_nvenc() -> bool:
+    """Check whether the local ffmpeg build exposes the NVENC h264 encoder"""
+    try:
+        probe = subprocess.run(
+            ["ffmpeg", "-hide_banner", "-encoders"],
+            capture_output=True, text=True, timeout=10
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return False
+    return "h264_nvenc" in probe.stdout
+
+def export_episode_video(audio_bytes: bytes, cover_image_path: str) -> bytes:
+    """
+    Render the episode as an MP4 with a static cover image
+
+    Runs entirely inside one ffmpeg process: the audio stream is copied
+    verbatim and the single looped cover frame is encoded with
+    h264_nvenc when the GPU encoder is available, libx264 otherwise.
+    Useful for platforms that only accept video uploads.
+
+    Args:
+        audio_bytes: Episode audio (MP3) as returned by synthesize_episode
+        cover_image_path: Path to the cover image (jpg/png)
+
+    Returns:
+        MP4 file contents as bytes
+
+    Raises:
+        Exception: If ffmpeg is missing or the render fails
+    """
+    if not shutil.which("ffmpeg"):
+        raise Exception("ffmpeg is required for video export")
+
+    video_codec = "h264_nvenc" if _ffmpeg_has_nvenc() else "libx264"
+
+    with tempfile.TemporaryDirectory(prefix="podcast_video_") as tmpdir:
+        audio_path = os.path.join(tmpdir, "episode.mp3")
+        with open(audio_path, "wb") as f:
+            f.write(audio_bytes)
+
+        out_path = os.path.join(tmpdir, "episode.mp4")
+        try:
+            subprocess.run(
+                ["ffmpeg", "-loglevel", "error", "-y",
+                 "-loop", "1", "-i", cover_image_path,
+                 "-i", audio_path,
+                 "-c:v", video_codec, "-tune", "stillimage",
+                 "-c:a", "copy", "-shortest",
+                 "-pix_fmt", "yuv420p", out_path],
+                check=True, capture_output=True
+            )
+        except subprocess.CalledProcessError as e:
+            stderr = e.stderr.decode(errors="replace") if e.stderr else ""
+            raise Exception(f"Video export failed: {stderr.strip()}")
+
+        with open(out_path, "rb") as f:
+            return f.read()
+
 def test_audio_setup() -> bool:
     """
     Test if audio synthesis dependencies are available
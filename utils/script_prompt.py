@@ -3,7 +3,32 @@ Script generation prompts for OpenAI to create conversational podcast scripts.
 Generates structured prompts for Australian-style conversational content.
 """
 
-from typing import List, Dict, Any
+import asyncio
+import hashlib
+import json
+import logging
+import random
+import re
+import unicodedata
+from functools import lru_cache
+from pathlib import Path
+from types import MappingProxyType
+from typing import List, Dict, Any, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+# orjson parses in C and is several times faster than the stdlib on the
+# multi-KB script responses; fall back to json when it isn't installed.
+# Both raise ValueError subclasses on malformed input.
+try:
+    import orjson as _orjson
+    _loads = _orjson.loads
+except ImportError:
+    _loads = json.loads
+
+class ScriptValidationError(Exception):
+    """Raised when a model response is not a usable podcast script"""
+    pass
 
 def build_messages(
     article_title: str,
@@ -25,9 +50,14 @@ def build_messages(
     Returns:
         List of OpenAI chat message dictionaries
     """
-    
-    style_instruction = _get_style_instruction(aussie)
-    system_prompt = _build_system_prompt(host_name, guest_name, style_instruction)
+
+    # Canonicalize the variable fields: stray whitespace or casing
+    # differences in names produce byte-different prompts that silently
+    # miss provider prefix caches
+    host_name = host_name.strip().title()
+    guest_name = guest_name.strip().title()
+
+    system_prompt = _build_system_prompt(aussie)
     user_prompt = _build_user_prompt(article_title, article_text, host_name, guest_name)
     
     return [
@@ -35,8 +65,9 @@ def build_messages(
         {"role": "user", "content": user_prompt}
     ]
 
+@lru_cache(maxsize=2)
 def _get_style_instruction(aussie: bool) -> str:
-    """Get style-specific instructions"""
+    """Get style-specific instructions (cached - only two possible results)"""
     if aussie:
         return """
 Use Australian conversational style with these characteristics:
@@ -58,15 +89,12 @@ Use natural, conversational style with these characteristics:
 - Balance of casual conversation and informative content
 """
 
-def _build_system_prompt(host_name: str, guest_name: str, style_instruction: str) -> str:
-    """Build the system prompt for OpenAI"""
+def _compose_system_prompt(style_instruction: str) -> str:
+    """Assemble a system prompt for the given style (run once at import)"""
+    style_instruction = style_instruction.strip()
     return f"""You are an expert podcast script writer creating engaging conversational content.
 
-Your task is to convert article content into a natural, flowing conversation between two podcast hosts.
-
-CHARACTERS:
-- {host_name}: The primary host who introduces topics and guides the conversation
-- {guest_name}: The co-host who provides insights, asks questions, and adds commentary
+Your task is to convert article content into a natural, flowing conversation between two podcast hosts. The hosts are introduced in the user message.
 
 STYLE REQUIREMENTS:
 {style_instruction}
@@ -94,25 +122,47 @@ CONTENT GUIDELINES:
 - Balance information delivery with conversational flow
 - Add context and explanations for technical terms"""
 
-def _build_user_prompt(article_title: str, article_text: str, host_name: str, guest_name: str) -> str:
-    """Build the user prompt with article content"""
-    
-    # Limit article text length to avoid token limits
-    max_length = 4000
-    if len(article_text) > max_length:
-        article_text = article_text[:max_length] + "..."
-    
-    return f"""Create a conversational podcast script based on this article:
+# Frozen system prompts, one per style, with no interpolated fields:
+# provider prompt caches only hit on byte-identical prefixes, so
+# everything speaker-specific lives at the tail of the user prompt
+def _canonicalize(prompt: str) -> str:
+    """NFC-normalize a prompt so equivalent Unicode yields identical bytes"""
+    return unicodedata.normalize("NFC", prompt)
 
-ARTICLE TITLE: {article_title}
+_SYSTEM_PROMPT_AUSSIE = _canonicalize(_compose_system_prompt(_get_style_instruction(True)))
+_SYSTEM_PROMPT_NEUTRAL = _canonicalize(_compose_system_prompt(_get_style_instruction(False)))
 
-ARTICLE CONTENT:
-{article_text}
+# Provider prefix caching only engages above ~1024 tokens of identical
+# prefix; flag short system prompts once at import (rough len/4 estimate)
+for _prompt in (_SYSTEM_PROMPT_AUSSIE, _SYSTEM_PROMPT_NEUTRAL):
+    if len(_prompt) // 4 < 1024:
+        logger.warning(
+            "System prompt is ~%d tokens (<1024); provider prompt caching "
+            "will only engage once the static user-prompt head is counted in",
+            len(_prompt) // 4
+        )
+del _prompt
 
-Create a natural conversation between {host_name} (host) and {guest_name} (guest) discussing this article. 
+def _build_system_prompt(aussie: bool) -> str:
+    """Select the frozen system prompt for the requested style"""
+    return _SYSTEM_PROMPT_AUSSIE if aussie else _SYSTEM_PROMPT_NEUTRAL
+
+# Static user-prompt segments, precomputed at import so each call is one
+# str.join over existing objects instead of re-interpolating an f-string
+# template - and the static bytes stay identical across calls
+_USER_PROMPT_HEAD = "Create a conversational podcast script based on this article:\n\nARTICLE TITLE: "
+_USER_PROMPT_BEFORE_ARTICLE = "\n\nARTICLE CONTENT:\n"
+_USER_PROMPT_ELLIPSIS = "..."
+_USER_PROMPT_TAIL_TEMPLATE = """
+
+CHARACTERS:
+- {host}: The primary host who introduces topics and guides the conversation
+- {guest}: The co-host who provides insights, asks questions, and adds commentary
+
+Create a natural conversation between {host} (host) and {guest} (guest) discussing this article.
 
 The conversation should:
-1. Open with {host_name} introducing the topic in an engaging way
+1. Open with {host} introducing the topic in an engaging way
 2. Have both hosts explore the key points naturally
 3. Include questions, reactions, and insights from both perspectives
 4. Make the content accessible and interesting for general audiences
@@ -120,6 +170,621 @@ The conversation should:
 
 Remember to return ONLY the JSON response with no additional text or formatting."""
 
+# Token budget for the article body. 6000 tokens leaves ample headroom in
+# gpt-4o-class context windows while fitting 3-4x more English text (and
+# far more Urdu, which runs >2 bytes/token) than the old 4000-char cap
+_ARTICLE_MAX_TOKENS = 6000
+# Char fallback when tiktoken is unavailable: the original conservative
+# cap. Scaling it to the token budget at ~4 chars/token only holds for
+# English - Urdu script runs far fewer chars per token, so a scaled cap
+# could overshoot smaller model contexts exactly when the encoder that
+# would catch it is missing
+_ARTICLE_MAX_CHARS = 4000
+
+@lru_cache(maxsize=1)
+def _get_encoder():
+    """Load the gpt-4o tokenizer once, or None if tiktoken is missing"""
+    try:
+        import tiktoken
+        return tiktoken.encoding_for_model("gpt-4o")
+    except Exception:
+        return None
+
+def _truncate_article(article_text: str) -> List[str]:
+    """
+    Cut the article to the token budget, returning prompt segments
+
+    Token-accurate truncation packs the context instead of guessing at
+    4 chars/token, and yields a stable prefix length for provider cache
+    thresholds. Falls back to a character cap when tiktoken is absent.
+    """
+    encoder = _get_encoder()
+    if encoder is not None:
+        ids = encoder.encode(article_text)
+        if len(ids) > _ARTICLE_MAX_TOKENS:
+            return [encoder.decode(ids[:_ARTICLE_MAX_TOKENS]), _USER_PROMPT_ELLIPSIS]
+        return [article_text]
+    if len(article_text) > _ARTICLE_MAX_CHARS:
+        return [article_text[:_ARTICLE_MAX_CHARS], _USER_PROMPT_ELLIPSIS]
+    return [article_text]
+
+def _build_user_prompt(article_title: str, article_text: str, host_name: str, guest_name: str) -> str:
+    """Build the user prompt with article content"""
+
+    parts = [_USER_PROMPT_HEAD, article_title, _USER_PROMPT_BEFORE_ARTICLE]
+    parts.extend(_truncate_article(article_text))
+    parts.append(_USER_PROMPT_TAIL_TEMPLATE.format(host=host_name, guest=guest_name))
+
+    return "".join(parts)
+
+async def agenerate_script(
+    article: Dict[str, str],
+    client: Any,
+    sem: "asyncio.Semaphore",
+    host_name: str = "Alex",
+    guest_name: str = "Sarah",
+    aussie: bool = True,
+    model: str = "gpt-4o-mini",
+    max_retries: int = 3
+) -> Dict[str, Any]:
+    """
+    Generate and validate one podcast script under a shared concurrency cap
+
+    The OpenAI client is injected so this module stays dependency-free:
+    any object exposing an awaitable chat.completions.create(...) works.
+    Transient failures are retried with capped, jittered backoff.
+
+    Args:
+        article: Dictionary with 'title' and 'text' keys (scrape output)
+        sem: Semaphore bounding in-flight requests across the batch
+        model: Chat model to use
+
+    Returns:
+        Validated script dictionary (see validate_script_response)
+    """
+    messages = build_messages(
+        article["title"], article["text"], host_name, guest_name, aussie
+    )
+    async with sem:
+        for attempt in range(max_retries):
+            try:
+                response = await client.chat.completions.create(
+                    model=model,
+                    messages=messages,
+                    temperature=0.7
+                )
+                break
+            except Exception:
+                if attempt == max_retries - 1:
+                    raise
+                await asyncio.sleep(min(30, 2 ** attempt) + random.uniform(0, 0.5))
+
+    return validate_script_response(
+        response.choices[0].message.content, host_name, guest_name
+    )
+
+async def generate_many(
+    articles: List[Dict[str, str]],
+    client: Any,
+    concurrency: int = 20,
+    **kwargs: Any
+) -> List[Dict[str, Any]]:
+    """
+    Generate scripts for several articles concurrently
+
+    Fires all requests at once under a Semaphore so network and model
+    wait time overlap; total wall time approaches the slowest single
+    generation instead of the sum.
+
+    Args:
+        articles: Dictionaries with 'title' and 'text' keys
+        client: Async OpenAI-compatible client (see agenerate_script)
+        concurrency: Maximum simultaneous in-flight requests
+        **kwargs: Forwarded to agenerate_script (names, style, model)
+
+    Returns:
+        Validated scripts in the same order as the input articles
+    """
+    sem = asyncio.Semaphore(concurrency)
+    return await asyncio.gather(
+        *[agenerate_script(article, client, sem, **kwargs) for article in articles]
+    )
+
+# Instructions prepended to a batched request; the per-article format
+# matches the single-script prompt so turn validation is shared
+_BATCH_PROMPT_HEAD = """Create a conversational podcast script for EACH of the numbered articles below.
+
+Return ONLY valid JSON of the form {"scripts": [{"id": <article number>, "script": [list of turns]}]} with exactly one entry per article. Each "script" list uses the same turn format as a single script: {"speaker": "host" or "guest", "text": "spoken content"}.
+"""
+
+def _build_batch_user_prompt(articles: List[Dict[str, str]], host_name: str, guest_name: str) -> str:
+    """Build one user prompt covering every article in a batch"""
+    parts = [_BATCH_PROMPT_HEAD]
+    for i, article in enumerate(articles):
+        parts.append(f"\n--- ARTICLE {i} ---\nARTICLE TITLE: ")
+        parts.append(article["title"])
+        parts.append("\n\nARTICLE CONTENT:\n")
+        parts.extend(_truncate_article(article["text"]))
+        parts.append("\n")
+    parts.append(_USER_PROMPT_TAIL_TEMPLATE.format(host=host_name, guest=guest_name))
+    return "".join(parts)
+
+class BatchingScriptGenerator:
+    """
+    Coalesce bursts of script requests into single model calls
+
+    Submissions are buffered for up to `window` seconds or until
+    `batch_size` are pending, then sent as one multi-article prompt whose
+    response carries every script. This amortises the per-request
+    HTTP/TLS/auth overhead across a burst (rapid regenerate clicks, bulk
+    imports) at the cost of at most `window` added latency. With
+    batch_size=1 every request passes straight through agenerate_script.
+
+    The client is injected exactly as in agenerate_script: any object
+    with an awaitable chat.completions.create(...) works.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        batch_size: int = 8,
+        window: float = 0.25,
+        host_name: str = "Alex",
+        guest_name: str = "Sarah",
+        aussie: bool = True,
+        model: str = "gpt-4o-mini"
+    ):
+        self._client = client
+        self._batch_size = max(1, batch_size)
+        self._window = window
+        self._host_name = host_name
+        self._guest_name = guest_name
+        self._aussie = aussie
+        self._model = model
+        self._queue: "asyncio.Queue" = asyncio.Queue()
+        self._sem = asyncio.Semaphore(self._batch_size)
+        self._worker = None
+
+    async def generate(self, article: Dict[str, str]) -> Dict[str, Any]:
+        """
+        Queue one article and await its validated script
+
+        Args:
+            article: Dictionary with 'title' and 'text' keys (scrape output)
+
+        Returns:
+            Validated script dictionary (see validate_script_response)
+        """
+        if self._batch_size == 1:
+            return await agenerate_script(
+                article, self._client, self._sem,
+                self._host_name, self._guest_name, self._aussie, self._model
+            )
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((article, future))
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.ensure_future(self._drain())
+        return await future
+
+    async def _drain(self):
+        """Collect pending requests into batches until the queue idles"""
+        while True:
+            try:
+                batch = [await asyncio.wait_for(self._queue.get(), timeout=self._window)]
+            except asyncio.TimeoutError:
+                # A put can land between the getter timing out and this
+                # task finishing; generate() would then see a not-yet-done
+                # worker and never spawn another, stranding the request.
+                # Re-checking here closes that window: from this point to
+                # task completion there are no awaits, so no new put can
+                # interleave before done() becomes True.
+                if not self._queue.empty():
+                    continue
+                return
+            deadline = asyncio.get_running_loop().time() + self._window
+            while len(batch) < self._batch_size:
+                remaining = deadline - asyncio.get_running_loop().time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout=remaining))
+                except asyncio.TimeoutError:
+                    break
+            await self._flush(batch)
+
+    async def _flush(self, batch):
+        """Send one model call for the batch and resolve every future"""
+        if len(batch) == 1:
+            article, future = batch[0]
+            try:
+                future.set_result(await agenerate_script(
+                    article, self._client, self._sem,
+                    self._host_name, self._guest_name, self._aussie, self._model
+                ))
+            except Exception as e:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        try:
+            messages = [
+                {"role": "system", "content": _build_system_prompt(self._aussie)},
+                {"role": "user", "content": _build_batch_user_prompt(
+                    [article for article, _ in batch], self._host_name, self._guest_name
+                )}
+            ]
+            response = await self._client.chat.completions.create(
+                model=self._model,
+                messages=messages,
+                temperature=0.7
+            )
+            scripts = self._parse_batch(response.choices[0].message.content)
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for i, (_, future) in enumerate(batch):
+            if future.done():
+                continue
+            result = scripts.get(i)
+            if result is None:
+                future.set_exception(
+                    ScriptValidationError(f"Batch response missing script for article {i}")
+                )
+            elif isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    def _parse_batch(self, response_text: str) -> Dict[int, Any]:
+        """
+        Parse a batch response into per-article validated scripts
+
+        Returns a dict mapping article id to either a validated script or
+        the ScriptValidationError for that sub-script, so one bad entry
+        doesn't fail the rest of the batch.
+        """
+        cleaned_text = _strip_fences(response_text)
+        try:
+            parsed = _loads(cleaned_text)
+        except ValueError as e:
+            raise ScriptValidationError(f"Invalid JSON response: {str(e)}")
+
+        if not isinstance(parsed, dict) or not isinstance(parsed.get("scripts"), list):
+            raise ScriptValidationError("Batch response must contain a 'scripts' list")
+
+        scripts: Dict[int, Any] = {}
+        for entry in parsed["scripts"]:
+            if not isinstance(entry, dict) or "id" not in entry:
+                continue
+            try:
+                scripts[entry["id"]] = _validate_parsed(
+                    {"script": entry.get("script")}, self._host_name, self._guest_name
+                )
+            except ScriptValidationError as e:
+                scripts[entry["id"]] = e
+            except Exception as e:
+                scripts[entry["id"]] = ScriptValidationError(f"Error validating script: {str(e)}")
+        return scripts
+
+# Validated scripts cached on the article content: generation is
+# effectively deterministic in the article for a fixed style, and repeat
+# submissions (common while iterating on voices/pauses) shouldn't pay the
+# LLM round trip again. Memory tier for the session, JSON files under
+# ~/.cache/podcast_app/scripts for cross-session reuse.
+_SCRIPT_CACHE_DIR = Path.home() / ".cache" / "podcast_app" / "scripts"
+_SCRIPT_MEMORY_CACHE: Dict[str, Dict[str, Any]] = {}
+
+def _script_cache_key(article_text: str, host_name: str, guest_name: str, aussie: bool) -> str:
+    """Derive the cache key for one article/style combination"""
+    payload = f"{aussie}|{host_name}|{guest_name}|{article_text}"
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+def _copy_script(script: Dict[str, Any]) -> Dict[str, Any]:
+    """Return a caller-owned copy so mutations can't poison the cache"""
+    return {"script": [dict(turn) for turn in script["script"]]}
+
+def generate_script_cached(
+    article_title: str,
+    article_text: str,
+    completion_fn: Callable[[List[Dict[str, str]]], str],
+    host_name: str = "Alex",
+    guest_name: str = "Sarah",
+    aussie: bool = True,
+    force_refresh: bool = False
+) -> Dict[str, Any]:
+    """
+    Generate a validated podcast script, caching results on article content
+
+    On a cache hit the entire LLM round trip is skipped and the stored
+    script returns in microseconds. The completion function is injected
+    (it receives the built messages and returns the raw response text) so
+    this module stays free of an openai dependency.
+
+    Args:
+        article_title: Title of the article
+        article_text: Main content of the article
+        completion_fn: Callable that sends the messages and returns the
+            model's response text
+        host_name: Name of the podcast host
+        guest_name: Name of the podcast guest
+        aussie: Whether to use Australian conversational style
+        force_refresh: Bypass the cache and regenerate
+
+    Returns:
+        Validated script dictionary (see validate_script_response)
+    """
+    key = _script_cache_key(article_text, host_name, guest_name, aussie)
+
+    if not force_refresh:
+        cached = _SCRIPT_MEMORY_CACHE.get(key)
+        if cached is None:
+            path = _SCRIPT_CACHE_DIR / f"{key}.json"
+            try:
+                if path.is_file():
+                    cached = json.loads(path.read_text(encoding="utf-8"))
+                    _SCRIPT_MEMORY_CACHE[key] = cached
+            except (OSError, ValueError):
+                cached = None
+        if cached is not None:
+            return _copy_script(cached)
+
+    messages = build_messages(article_title, article_text, host_name, guest_name, aussie)
+    validated = validate_script_response(completion_fn(messages), host_name, guest_name)
+
+    _SCRIPT_MEMORY_CACHE[key] = validated
+    try:
+        _SCRIPT_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        (_SCRIPT_CACHE_DIR / f"{key}.json").write_text(
+            json.dumps(validated, ensure_ascii=False), encoding="utf-8"
+        )
+    except OSError:
+        pass
+
+    return _copy_script(validated)
+
+def extract_complete_turns(partial_response: str) -> List[Dict[str, str]]:
+    """
+    Extract completed script turns from a partial (streaming) response
+
+    Scans the buffered text for balanced {...} objects inside the script
+    array and parses each candidate, so callers can act on finished turns
+    while the rest of the response is still streaming.
+
+    Args:
+        partial_response: Response text accumulated so far
+
+    Returns:
+        List of turn dictionaries that are fully formed in the buffer
+    """
+    turns = []
+    # Skip everything before the script array so the outer object's brace
+    # isn't mistaken for a turn object
+    array_start = partial_response.find('[')
+    if array_start == -1:
+        return turns
+
+    depth = 0
+    start = None
+    in_string = False
+    escaped = False
+    for i in range(array_start, len(partial_response)):
+        ch = partial_response[i]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif ch == '\\':
+                escaped = True
+            elif ch == '"':
+                in_string = False
+            continue
+        if ch == '"':
+            in_string = True
+        elif ch == '{':
+            if depth == 0:
+                start = i
+            depth += 1
+        elif ch == '}':
+            depth -= 1
+            if depth == 0 and start is not None:
+                try:
+                    obj = _loads(partial_response[start:i + 1])
+                except ValueError:
+                    obj = None
+                if isinstance(obj, dict) and 'speaker' in obj and 'text' in obj:
+                    turns.append(obj)
+                start = None
+    return turns
+
+# Known speaker labels per role, independent of the configured names.
+# Frozen so the lookup builder and any future heuristics share one
+# hashed alias set instead of re-listing literals
+_HOST_ALIASES = frozenset({"host", "alex"})
+_GUEST_ALIASES = frozenset({"guest", "sarah"})
+
+@lru_cache(maxsize=8)
+def _speaker_lookup(host_name: str, guest_name: str):
+    """
+    Build the speaker-normalization tables for one host/guest name pair
+
+    Returns a (speaker_map, substring_checks) pair: an exact-match dict
+    over the alias sets plus the configured names (one hashed lookup
+    covers every exact label), and an ordered list of (fragment, role)
+    fallbacks for fuzzy labels like "Host Alex". Cached so validation
+    pays one O(1) lookup per turn instead of rebuilding comparisons for
+    every turn of every script.
+    """
+    host_lower = host_name.lower()
+    guest_lower = guest_name.lower()
+    # Configured names inserted last so they win over the default aliases
+    speaker_map = {alias: "host" for alias in _HOST_ALIASES}
+    speaker_map.update((alias, "guest") for alias in _GUEST_ALIASES)
+    speaker_map[host_lower] = "host"
+    speaker_map[guest_lower] = "guest"
+    substring_checks = (
+        [(host_lower, "host")]
+        + [(alias, "host") for alias in sorted(_HOST_ALIASES)]
+        + [(guest_lower, "guest")]
+        + [(alias, "guest") for alias in sorted(_GUEST_ALIASES)]
+    )
+    return speaker_map, substring_checks
+
+def _normalize_turn(turn: Any, i: int, host_name: str, guest_name: str, lookup=None) -> Dict[str, str]:
+    """
+    Validate one script turn and normalize its speaker to host/guest
+
+    Args:
+        turn: Raw turn object from the parsed response
+        i: Zero-based turn index (used in error messages)
+        host_name: Expected host name
+        guest_name: Expected guest name
+        lookup: Optional precomputed _speaker_lookup result, so loops
+            resolve the tables once instead of per turn
+
+    Returns:
+        Dict with normalized 'speaker' and stripped 'text'
+
+    Raises:
+        ScriptValidationError: If the turn is malformed
+    """
+    if not isinstance(turn, dict):
+        raise ScriptValidationError(f"Turn {i+1} must be an object")
+
+    if "speaker" not in turn or "text" not in turn:
+        raise ScriptValidationError(f"Turn {i+1} must have 'speaker' and 'text' fields")
+
+    speaker = turn["speaker"].strip()
+    text = turn["text"].strip()
+
+    # Normalize speaker names to host/guest via the precomputed lookup
+    speaker_map, substring_checks = lookup if lookup is not None else _speaker_lookup(host_name, guest_name)
+    speaker_lower = speaker.lower()
+    normalized_speaker = speaker_map.get(speaker_lower)
+    if normalized_speaker is None:
+        # Try to guess based on common patterns
+        for name, role in substring_checks:
+            if name in speaker_lower:
+                normalized_speaker = role
+                break
+        else:
+            raise ScriptValidationError(f"Turn {i+1}: unknown speaker '{speaker}'. Expected '{host_name}' (host) or '{guest_name}' (guest)")
+
+    # A single length check covers empty text as well
+    if len(text) < 10:
+        raise ScriptValidationError(f"Turn {i+1}: text too short (minimum 10 characters)")
+
+    return {
+        "speaker": normalized_speaker,
+        "text": text
+    }
+
+def validate_script_stream(chunks, host_name: str = "Alex", guest_name: str = "Sarah"):
+    """
+    Validate turns incrementally from a streaming response
+
+    Feeds accumulated stream fragments (e.g. OpenAI delta.content values)
+    through extract_complete_turns and yields each turn as soon as its
+    closing brace arrives, so the UI can speak/display the opening lines
+    while the model is still writing the rest.
+
+    Args:
+        chunks: Iterable of response text fragments in arrival order
+        host_name: Expected host name
+        guest_name: Expected guest name
+
+    Yields:
+        Normalized turn dicts (same shape as validate_script_response turns)
+
+    Raises:
+        ScriptValidationError: If a completed turn is malformed
+    """
+    lookup = _speaker_lookup(host_name, guest_name)
+    buffer_parts = []
+    emitted = 0
+    for chunk in chunks:
+        if not chunk:
+            continue
+        buffer_parts.append(chunk)
+        # Only rescan when this fragment could have closed a turn
+        if '}' not in chunk:
+            continue
+        turns = extract_complete_turns(''.join(buffer_parts))
+        for i in range(emitted, len(turns)):
+            yield _normalize_turn(turns[i], i, host_name, guest_name, lookup)
+        emitted = max(emitted, len(turns))
+
+    # Final rescan in case the closing fragments arrived without a rescan
+    turns = extract_complete_turns(''.join(buffer_parts))
+    for i in range(emitted, len(turns)):
+        yield _normalize_turn(turns[i], i, host_name, guest_name, lookup)
+
+# Compiled once at import: matches a whole response wrapped in markdown
+# code fences (``` or ```json) and captures the payload between them; the
+# open-only pattern handles truncated responses missing the closing fence
+_FENCE_RE = re.compile(r'^\s*```(?:json)?\s*\n?(.*?)\n?\s*```\s*$', re.DOTALL)
+_FENCE_OPEN_RE = re.compile(r'^```(?:json)?\s*\n?')
+
+def _strip_fences(response_text: str) -> str:
+    """
+    Remove markdown code fences around a model response
+
+    Tries the anchored full-wrap match first; if the response opens with a
+    fence but never closes it (a common truncation failure), the leading
+    fence line and any trailing ``` are stripped independently, matching
+    the original chained startswith/endswith behavior.
+    """
+    match = _FENCE_RE.match(response_text)
+    if match:
+        return match.group(1).strip()
+    cleaned = response_text.strip()
+    open_match = _FENCE_OPEN_RE.match(cleaned)
+    if open_match:
+        cleaned = cleaned[open_match.end():]
+    if cleaned.endswith('```'):
+        cleaned = cleaned[:-3]
+    return cleaned.strip()
+
+def _validate_parsed(parsed: Any, host_name: str, guest_name: str) -> Dict[str, Any]:
+    """
+    Validate an already-parsed response object and normalize its turns
+
+    Shared by validate_script_response and the batch generator, which
+    parses one payload holding several scripts.
+
+    Args:
+        parsed: Decoded JSON object expected to hold a 'script' list
+        host_name: Expected host name
+        guest_name: Expected guest name
+
+    Returns:
+        Parsed and validated script dictionary
+
+    Raises:
+        ScriptValidationError: If the structure or any turn is invalid
+    """
+    if not isinstance(parsed, dict):
+        raise ScriptValidationError("Response must be a JSON object")
+
+    if "script" not in parsed:
+        raise ScriptValidationError("Response must contain 'script' key")
+
+    script = parsed["script"]
+    if not isinstance(script, list):
+        raise ScriptValidationError("Script must be a list of turns")
+
+    if len(script) == 0:
+        raise ScriptValidationError("Script cannot be empty")
+
+    # Normalize speaker names and validate each turn; resolve the
+    # speaker tables once for the whole script
+    lookup = _speaker_lookup(host_name, guest_name)
+    return {"script": [
+        _normalize_turn(turn, i, host_name, guest_name, lookup)
+        for i, turn in enumerate(script)
+    ]}
+
 def validate_script_response(response_text: str, host_name: str = "Alex", guest_name: str = "Sarah") -> Dict[str, Any]:
     """
     Validate and parse OpenAI script response
@@ -133,122 +798,56 @@ def validate_script_response(response_text: str, host_name: str = "Alex", guest_
         Parsed and validated script dictionary
         
     Raises:
-        Exception: If response is invalid
+        ScriptValidationError: If response is invalid
     """
-    import json
-    import re
-    
     try:
-        # Clean the response text - remove markdown code blocks
-        cleaned_text = response_text.strip()
-        
-        # Remove ```json and ``` markers if present
-        if cleaned_text.startswith('```'):
-            # Find the first newline after ```json or ```
-            first_newline = cleaned_text.find('\n')
-            if first_newline != -1:
-                cleaned_text = cleaned_text[first_newline + 1:]
-        
-        if cleaned_text.endswith('```'):
-            cleaned_text = cleaned_text[:-3]
-        
-        # Remove any remaining leading/trailing whitespace
-        cleaned_text = cleaned_text.strip()
-        
-        # Parse JSON response
-        parsed = json.loads(cleaned_text)
-        
-        # Validate structure
-        if not isinstance(parsed, dict):
-            raise Exception("Response must be a JSON object")
-        
-        if "script" not in parsed:
-            raise Exception("Response must contain 'script' key")
-        
-        script = parsed["script"]
-        if not isinstance(script, list):
-            raise Exception("Script must be a list of turns")
-        
-        if len(script) == 0:
-            raise Exception("Script cannot be empty")
-        
-        # Normalize speaker names and validate each turn
-        normalized_script = []
-        for i, turn in enumerate(script):
-            if not isinstance(turn, dict):
-                raise Exception(f"Turn {i+1} must be an object")
-            
-            if "speaker" not in turn or "text" not in turn:
-                raise Exception(f"Turn {i+1} must have 'speaker' and 'text' fields")
-            
-            speaker = turn["speaker"].strip()
-            text = turn["text"].strip()
-            
-            # Normalize speaker names to host/guest
-            if speaker.lower() == host_name.lower():
-                normalized_speaker = "host"
-            elif speaker.lower() == guest_name.lower():
-                normalized_speaker = "guest"
-            elif speaker.lower() in ["host"]:
-                normalized_speaker = "host"
-            elif speaker.lower() in ["guest"]:
-                normalized_speaker = "guest"
-            else:
-                # Try to guess based on common patterns
-                if any(name in speaker.lower() for name in [host_name.lower(), "host", "alex"]):
-                    normalized_speaker = "host"
-                elif any(name in speaker.lower() for name in [guest_name.lower(), "guest", "sarah"]):
-                    normalized_speaker = "guest"
-                else:
-                    raise Exception(f"Turn {i+1}: unknown speaker '{speaker}'. Expected '{host_name}' (host) or '{guest_name}' (guest)")
-            
-            if not text:
-                raise Exception(f"Turn {i+1}: text cannot be empty")
-            
-            if len(text) < 10:
-                raise Exception(f"Turn {i+1}: text too short (minimum 10 characters)")
-            
-            normalized_script.append({
-                "speaker": normalized_speaker,
-                "text": text
-            })
-        
-        # Return the normalized script
-        return {"script": normalized_script}
-        
+        # Strip markdown code fences (```json ... ```), then parse
+        cleaned_text = _strip_fences(response_text)
+        parsed = _loads(cleaned_text)
+
+        return _validate_parsed(parsed, host_name, guest_name)
+
+    except ScriptValidationError:
+        raise
     except json.JSONDecodeError as e:
-        raise Exception(f"Invalid JSON response: {str(e)}")
+        raise ScriptValidationError(f"Invalid JSON response: {str(e)}")
     except Exception as e:
-        if "Response must" in str(e) or "Turn" in str(e) or "Script" in str(e):
-            raise e
-        raise Exception(f"Error validating script: {str(e)}")
+        raise ScriptValidationError(f"Error validating script: {str(e)}")
+
+# Demo data frozen at import: callers get references to read-only turns
+# instead of five freshly allocated dicts per call, and the fixture can't
+# be mutated by accident
+_SAMPLE_SCRIPT = tuple(MappingProxyType(turn) for turn in (
+    {
+        "speaker": "host",
+        "text": "G'day everyone! Welcome back to the podcast. I'm Alex, and today we've got some fascinating news to dive into with my co-host Sarah."
+    },
+    {
+        "speaker": "guest",
+        "text": "Thanks Alex! I'm really excited about today's topic. This article caught my attention because it touches on something we've all been thinking about lately."
+    },
+    {
+        "speaker": "host",
+        "text": "Too right! So let's jump straight in. The main story here is about how technology is changing the way we work and live. Sarah, what was your first reaction when you read this?"
+    },
+    {
+        "speaker": "guest",
+        "text": "Well mate, I reckon it's both exciting and a bit concerning. On one hand, we're seeing incredible innovations that could make life easier. But there's also this question of how it affects jobs and privacy."
+    },
+    {
+        "speaker": "host",
+        "text": "That's a fair point. The article mentions some specific examples that really drive home your point. Let's break down what the research actually found..."
+    }
+))
 
 def get_sample_script() -> List[Dict[str, str]]:
     """
     Get a sample script for testing purposes
-    
+
     Returns:
-        Sample script in the correct format
+        Sample script in the correct format. The turns are fresh plain
+        dicts so the sample stays interchangeable with real scripts
+        (JSON-serializable, cacheable) and mutations can't touch the
+        frozen fixture.
     """
-    return [
-        {
-            "speaker": "host",
-            "text": "G'day everyone! Welcome back to the podcast. I'm Alex, and today we've got some fascinating news to dive into with my co-host Sarah."
-        },
-        {
-            "speaker": "guest", 
-            "text": "Thanks Alex! I'm really excited about today's topic. This article caught my attention because it touches on something we've all been thinking about lately."
-        },
-        {
-            "speaker": "host",
-            "text": "Too right! So let's jump straight in. The main story here is about how technology is changing the way we work and live. Sarah, what was your first reaction when you read this?"
-        },
-        {
-            "speaker": "guest",
-            "text": "Well mate, I reckon it's both exciting and a bit concerning. On one hand, we're seeing incredible innovations that could make life easier. But there's also this question of how it affects jobs and privacy."
-        },
-        {
-            "speaker": "host",
-            "text": "That's a fair point. The article mentions some specific examples that really drive home your point. Let's break down what the research actually found..."
-        }
-    ]
+    return [dict(turn) for turn in _SAMPLE_SCRIPT]